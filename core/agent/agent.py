@@ -5,13 +5,16 @@ This module provides the core Agent class that orchestrates LLM interactions,
 tool calls, context management, and safety checks.
 """
 
+import asyncio
 import logging
-from typing import Any, AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, Literal, overload
 
 from core.agent.events import AgentEvent, AgentEventType
 from core.agent.session import Session
 from core.config.schema import Configuration
-from core.llm.models import StreamEventType, ToolCall, ToolResultMessage
+from core.constants import STREAM_FLUSH_MAX_DELTAS
+from core.llm.models import StreamEventType, ToolCall
 from core.prompts.builder import create_loop_breaker_prompt
 from core.safety.models import ToolConfirmation
 
@@ -81,12 +84,13 @@ class Agent:
         ...     if event.type == AgentEventType.TEXT_DELTA:
         ...         print(event.data["content"], end="")
         """
-        if not self.session:
+        session = self.session
+        if not session or session.context_manager is None:
             raise RuntimeError("Agent session not initialized")
 
-        await self.session.hook_system.trigger_before_agent(message)
+        await session.hook_system.trigger_before_agent(message)
         yield AgentEvent.agent_start(message)
-        self.session.context_manager.add_user_message(message)
+        session.context_manager.add_user_message(message)
 
         final_response: str | None = None
 
@@ -96,57 +100,161 @@ class Agent:
             if event.type == AgentEventType.TEXT_COMPLETE:
                 final_response = event.data.get("content")
 
-        await self.session.hook_system.trigger_after_agent(
+        await session.hook_system.trigger_after_agent(
             message,
             final_response or "",
         )
         yield AgentEvent.agent_end(final_response)
 
-    async def _agentic_loop(self) -> AsyncGenerator[AgentEvent, None]:
+    async def run_text_only(self, message: str) -> AsyncGenerator[str, None]:
+        """
+        Run the agent with a user message, yielding only response text.
+
+        This is a fast path for consumers that only render streamed text:
+        text deltas are yielded as plain strings without building an
+        ``AgentEvent`` for each one. Tool calls, hooks, and context
+        handling behave exactly as in ``run``; errors are logged.
+
+        Parameters
+        ----------
+        message : str
+            User message to process.
+
+        Yields
+        ------
+        str
+            Chunks of streamed response text.
+
+        Examples
+        --------
+        >>> async for chunk in agent.run_text_only("Hello!"):
+        ...     print(chunk, end="")
+        """
+        session = self.session
+        if not session or session.context_manager is None:
+            raise RuntimeError("Agent session not initialized")
+
+        await session.hook_system.trigger_before_agent(message)
+        session.context_manager.add_user_message(message)
+
+        final_response: str | None = None
+
+        async for event in self._agentic_loop(raw_text=True):
+            if isinstance(event, str):
+                yield event
+            elif event.type == AgentEventType.TEXT_COMPLETE:
+                final_response = event.data.get("content")
+            elif event.type == AgentEventType.AGENT_ERROR:
+                logger.error(f"Agent error: {event.data.get('error')}")
+
+        await session.hook_system.trigger_after_agent(
+            message,
+            final_response or "",
+        )
+
+    @overload
+    def _agentic_loop(
+        self,
+        raw_text: Literal[False] = ...,
+    ) -> AsyncGenerator[AgentEvent, None]: ...
+
+    @overload
+    def _agentic_loop(
+        self,
+        raw_text: Literal[True],
+    ) -> AsyncGenerator[AgentEvent | str, None]: ...
+
+    async def _agentic_loop(
+        self,
+        raw_text: bool = False,
+    ) -> AsyncGenerator[AgentEvent | str, None]:
         """
         Main agentic loop for processing turns.
 
+        Parameters
+        ----------
+        raw_text : bool, default=False
+            Yield text deltas as plain strings instead of ``AgentEvent``
+            instances.
+
         Yields
         ------
-        AgentEvent
-            Events from each turn of the agentic loop.
+        AgentEvent | str
+            Events from each turn of the agentic loop. Text deltas are
+            plain strings when ``raw_text`` is set and ``AgentEvent``
+            instances otherwise; the overloads give callers the narrowed
+            type.
         """
         max_turns: int = self.config.max_turns
+        flush_interval: float = self.config.flush_interval
+        loop_time: Callable[[], float] = asyncio.get_running_loop().time
 
-        if not self.session:
+        session = self.session
+        if not session or session.context_manager is None:
             raise RuntimeError("Agent session not initialized")
 
+        # Bind hot attributes once; they are read on every turn and token.
+        context_manager = session.context_manager
+        client = session.client
+        loop_detector = session.loop_detector
+        tool_registry = session.tool_registry
+        # str() returns an exact str unchanged, so raw mode costs one call.
+        text_delta: Callable[[str], AgentEvent | str] = (
+            str if raw_text else AgentEvent.text_delta
+        )
+
         for turn_num in range(max_turns):
-            self.session.increment_turn()
+            session.increment_turn()
             response_text: str = ""
 
             # Check for context overflow
-            if self.session.context_manager.needs_compression():
-                summary, usage = await self.session.chat_compactor.compress(
-                    self.session.context_manager,
+            if context_manager.needs_compression():
+                summary, usage = await session.chat_compactor.compress(
+                    context_manager,
                 )
 
                 if summary:
-                    self.session.context_manager.replace_with_summary(summary)
+                    context_manager.replace_with_summary(summary)
                     if usage:
-                        self.session.context_manager.set_latest_usage(usage)
-                        self.session.context_manager.add_usage(usage)
+                        context_manager.set_latest_usage(usage)
+                        context_manager.add_usage(usage)
 
-            tool_schemas = self.session.tool_registry.get_schemas()
+            tool_schemas = session.cached_tool_schemas
 
             tool_calls: list[ToolCall] = []
             usage = None
 
-            async for event in self.session.client.chat_completion(
-                self.session.context_manager.get_messages(),
-                tools=tool_schemas if tool_schemas else None,
+            # Coalesce text deltas so consumers are woken every few tokens
+            # (or every flush_interval seconds) instead of once per token.
+            pending_text: list[str] = []
+            last_flush: float = loop_time()
+
+            async for event in client.chat_completion(
+                context_manager.get_messages(),
+                tools=tool_schemas,
             ):
                 if event.type == StreamEventType.TEXT_DELTA:
                     if event.text_delta:
                         content: str = event.text_delta.content
                         response_text += content
-                        yield AgentEvent.text_delta(content)
-                elif event.type == StreamEventType.TOOL_CALL_COMPLETE:
+                        pending_text.append(content)
+
+                        now: float = loop_time()
+                        if (
+                            len(pending_text) >= STREAM_FLUSH_MAX_DELTAS
+                            or now - last_flush >= flush_interval
+                        ):
+                            yield text_delta("".join(pending_text))
+                            pending_text.clear()
+                            last_flush = now
+                    continue
+
+                if pending_text:
+                    yield text_delta("".join(pending_text))
+                    pending_text.clear()
+                    last_flush = loop_time()
+
+                if event.type == StreamEventType.TOOL_CALL_COMPLETE:
                     if event.tool_call:
                         tool_calls.append(event.tool_call)
                 elif event.type == StreamEventType.ERROR:
@@ -156,99 +264,117 @@ class Agent:
                 elif event.type == StreamEventType.MESSAGE_COMPLETE:
                     usage = event.usage
 
-            self.session.context_manager.add_assistant_message(
+            if pending_text:
+                yield text_delta("".join(pending_text))
+
+            tool_call_payload: list[dict[str, Any]] | None = (
+                [
+                    {
+                        "id": tc.call_id,
+                        "type": "function",
+                        "function": {
+                            "name": tc.name,
+                            "arguments": tc.arguments_json(),
+                        },
+                    }
+                    for tc in tool_calls
+                ]
+                if tool_calls
+                else None
+            )
+            context_manager.add_assistant_message(
                 response_text or None,
-                (
-                    [
-                        {
-                            "id": tc.call_id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": str(tc.arguments),
-                            },
-                        }
-                        for tc in tool_calls
-                    ]
-                    if tool_calls
-                    else None
-                ),
+                tool_call_payload,
             )
             if response_text:
                 yield AgentEvent.text_complete(response_text)
-                self.session.loop_detector.record_action(
+                loop_detector.record_action(
                     "response",
                     text=response_text,
                 )
 
             if not tool_calls:
                 if usage:
-                    self.session.context_manager.set_latest_usage(usage)
-                    self.session.context_manager.add_usage(usage)
+                    context_manager.set_latest_usage(usage)
+                    context_manager.add_usage(usage)
 
-                self.session.context_manager.prune_tool_outputs()
+                context_manager.prune_tool_outputs()
                 return
 
-            tool_call_results: list[ToolResultMessage] = []
-
-            for tool_call in tool_calls:
-                yield AgentEvent.tool_call_start(
-                    tool_call.call_id,
-                    tool_call.name,
-                    tool_call.arguments,
-                )
-
-                self.session.loop_detector.record_action(
-                    "tool_call",
-                    tool_name=tool_call.name,
-                    args=tool_call.arguments,
-                )
-
-                result = await self.session.tool_registry.invoke(
-                    tool_call.name,
-                    tool_call.arguments,
-                    self.config.cwd,
-                    self.session.hook_system,
-                    self.session.approval_manager,
-                )
+            error_count: int = 0
+
+            # Consecutive parallel-safe calls run concurrently as one batch;
+            # any other call runs on its own, so relative order is preserved.
+            batch_start: int = 0
+            while batch_start < len(tool_calls):
+                batch_end: int = batch_start + 1
+                if tool_registry.is_parallel_safe(tool_calls[batch_start].name or ""):
+                    while batch_end < len(tool_calls) and (
+                        tool_registry.is_parallel_safe(tool_calls[batch_end].name or "")
+                    ):
+                        batch_end += 1
+                batch: list[ToolCall] = tool_calls[batch_start:batch_end]
+                batch_start = batch_end
+
+                for tool_call in batch:
+                    yield AgentEvent.tool_call_start(
+                        tool_call.call_id,
+                        tool_call.name or "",
+                        tool_call.arguments_dict(),
+                    )
 
-                yield AgentEvent.tool_call_complete(
-                    tool_call.call_id,
-                    tool_call.name,
-                    result,
-                )
+                    loop_detector.record_action(
+                        "tool_call",
+                        tool_name=tool_call.name,
+                        args=tool_call.arguments,
+                    )
 
-                tool_call_results.append(
-                    ToolResultMessage(
-                        tool_call_id=tool_call.call_id,
-                        content=result.to_model_output(),
-                        is_error=not result.success,
+                results = await asyncio.gather(
+                    *(
+                        tool_registry.invoke(
+                            tool_call.name or "",
+                            tool_call.arguments_dict(),
+                            self.config.cwd,
+                            session.hook_system,
+                            session.approval_manager,
+                        )
+                        for tool_call in batch
                     ),
                 )
 
-            for tool_result in tool_call_results:
-                self.session.context_manager.add_tool_result(
-                    tool_result.tool_call_id,
-                    tool_result.content,
+                # Record the whole batch at once so its outputs are
+                # tokenized together.
+                context_manager.add_tool_results(
+                    [
+                        (tool_call.call_id, result.to_model_output())
+                        for tool_call, result in zip(batch, results, strict=True)
+                    ],
                 )
 
-            loop_detection_error = self.session.loop_detector.check_for_loop()
+                for tool_call, result in zip(batch, results, strict=True):
+                    yield AgentEvent.tool_call_complete(
+                        tool_call.call_id,
+                        tool_call.name or "",
+                        result,
+                    )
+                    if not result.success:
+                        error_count += 1
+
+            loop_detection_error = loop_detector.check_for_loop()
             if loop_detection_error:
                 loop_prompt = create_loop_breaker_prompt(loop_detection_error)
-                self.session.context_manager.add_user_message(loop_prompt)
+                context_manager.add_user_message(loop_prompt)
                 logger.warning(f"Loop detected: {loop_detection_error}")
 
             # Check for repeated errors
-            if tool_call_results:
-                error_count = sum(1 for r in tool_call_results if r.is_error)
-                if error_count > 0:
-                    logger.warning(f"Tool call errors in turn {turn_num + 1}: {error_count}")
+            if error_count > 0:
+                logger.warning(f"Tool call errors in turn {turn_num + 1}: {error_count}")
 
             if usage:
-                self.session.context_manager.set_latest_usage(usage)
-                self.session.context_manager.add_usage(usage)
+                context_manager.set_latest_usage(usage)
+                context_manager.add_usage(usage)
 
-            self.session.context_manager.prune_tool_outputs()
+            context_manager.prune_tool_outputs()
 
         yield AgentEvent.agent_error(
             f"Maximum turns ({max_turns}) reached. Consider breaking the task into smaller steps.",
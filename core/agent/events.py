@@ -5,16 +5,15 @@ This module defines event types and models for tracking agent operations,
 tool calls, and text streaming.
 """
 
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 from core.llm.models import TokenUsage
 from core.tools.models import ToolResult
 
 
-class AgentEventType(str, Enum):
+class AgentEventType(StrEnum):
     """
     Types of events emitted by the agent.
 
@@ -56,10 +55,19 @@ class AgentEventType(str, Enum):
     TEXT_COMPLETE = "text_complete"
 
 
-class AgentEvent(BaseModel):
+# Bound once at import so the per-token ``text_delta`` path is a single global read.
+_TEXT_DELTA: AgentEventType = AgentEventType.TEXT_DELTA
+
+
+@dataclass(slots=True, frozen=True)
+class AgentEvent:
     """
     Event emitted by the agent during execution.
 
+    Events are plain slotted dataclasses rather than Pydantic models: they
+    are created once per streamed token, so construction must not pay for
+    validation.
+
     Parameters
     ----------
     type : AgentEventType
@@ -74,8 +82,8 @@ class AgentEvent(BaseModel):
     >>> event = AgentEvent.tool_call_complete("call_123", "read_file", result)
     """
 
-    type: AgentEventType = Field(description="Event type")
-    data: dict[str, Any] = Field(default_factory=dict, description="Event data")
+    type: AgentEventType
+    data: dict[str, Any] = field(default_factory=dict)
 
     @classmethod
     def agent_start(cls, message: str) -> "AgentEvent":
@@ -93,8 +101,8 @@ class AgentEvent(BaseModel):
             Agent start event.
         """
         return cls(
-            type=AgentEventType.AGENT_START,
-            data={"message": message},
+            AgentEventType.AGENT_START,
+            {"message": message},
         )
 
     @classmethod
@@ -119,10 +127,10 @@ class AgentEvent(BaseModel):
             Agent end event.
         """
         return cls(
-            type=AgentEventType.AGENT_END,
-            data={
+            AgentEventType.AGENT_END,
+            {
                 "response": response,
-                "usage": usage.model_dump() if usage else None,
+                "usage": usage.to_dict() if usage else None,
             },
         )
 
@@ -148,8 +156,8 @@ class AgentEvent(BaseModel):
             Agent error event.
         """
         return cls(
-            type=AgentEventType.AGENT_ERROR,
-            data={"error": error, "details": details or {}},
+            AgentEventType.AGENT_ERROR,
+            {"error": error, "details": details or {}},
         )
 
     @classmethod
@@ -167,10 +175,7 @@ class AgentEvent(BaseModel):
         AgentEvent
             Text delta event.
         """
-        return cls(
-            type=AgentEventType.TEXT_DELTA,
-            data={"content": content},
-        )
+        return cls(_TEXT_DELTA, {"content": content})
 
     @classmethod
     def text_complete(cls, content: str) -> "AgentEvent":
@@ -188,8 +193,8 @@ class AgentEvent(BaseModel):
             Text complete event.
         """
         return cls(
-            type=AgentEventType.TEXT_COMPLETE,
-            data={"content": content},
+            AgentEventType.TEXT_COMPLETE,
+            {"content": content},
         )
 
     @classmethod
@@ -217,8 +222,8 @@ class AgentEvent(BaseModel):
             Tool call start event.
         """
         return cls(
-            type=AgentEventType.TOOL_CALL_START,
-            data={
+            AgentEventType.TOOL_CALL_START,
+            {
                 "call_id": call_id,
                 "name": name,
                 "arguments": arguments,
@@ -250,8 +255,8 @@ class AgentEvent(BaseModel):
             Tool call complete event.
         """
         return cls(
-            type=AgentEventType.TOOL_CALL_COMPLETE,
-            data={
+            AgentEventType.TOOL_CALL_COMPLETE,
+            {
                 "call_id": call_id,
                 "name": name,
                 "success": result.success,
@@ -5,23 +5,86 @@ This module provides functionality to save and load agent session state
 for resuming conversations and creating checkpoints.
 """
 
-import json
+import asyncio
+import heapq
 import logging
 import os
+import tempfile
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from core.config.loader import get_data_dir
 from core.llm.models import TokenUsage
 
 logger = logging.getLogger(__name__)
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Atomically write bytes to a file with owner-only permissions.
+
+    The pre-encoded buffer is written straight to a temporary file in the
+    same directory with ``os.write`` (no buffered file object), synced to
+    disk, and moved over the destination with ``os.replace``.
+
+    Parameters
+    ----------
+    path : Path
+        Destination file path.
+    data : bytes
+        Encoded file content.
+    """
+    # mkstemp already creates the file with mode 0o600.
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+    )
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _to_timestamp(value: float | str) -> float:
+    """
+    Normalize a persisted timestamp to epoch seconds.
+
+    Parameters
+    ----------
+    value : float | str
+        Epoch seconds, or an ISO 8601 string from older session files.
+
+    Returns
+    -------
+    float
+        Epoch seconds.
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return value
+
+
+@dataclass(slots=True)
 class SessionSnapshot:
     """
     Snapshot of agent session state.
 
+    Snapshots are slotted dataclasses built from trusted session state,
+    so they carry no validation layer and serialize directly with orjson.
+
     Parameters
     ----------
     session_id : str
@@ -49,21 +112,12 @@ class SessionSnapshot:
     ... )
     """
 
-    def __init__(
-        self,
-        session_id: str,
-        created_at: datetime,
-        updated_at: datetime,
-        turn_count: int,
-        messages: list[dict[str, Any]],
-        total_usage: TokenUsage,
-    ) -> None:
-        self.session_id: str = session_id
-        self.created_at: datetime = created_at
-        self.updated_at: datetime = updated_at
-        self.turn_count: int = turn_count
-        self.messages: list[dict[str, Any]] = messages
-        self.total_usage: TokenUsage = total_usage
+    session_id: str
+    created_at: datetime
+    updated_at: datetime
+    turn_count: int
+    messages: list[dict[str, Any]]
+    total_usage: TokenUsage
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -76,11 +130,11 @@ class SessionSnapshot:
         """
         return {
             "session_id": self.session_id,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at.timestamp(),
+            "updated_at": self.updated_at.timestamp(),
             "turn_count": self.turn_count,
             "messages": self.messages,
-            "total_usage": self.total_usage.model_dump(),
+            "total_usage": self.total_usage.to_dict(),
         }
 
     @classmethod
@@ -88,6 +142,9 @@ class SessionSnapshot:
         """
         Create snapshot from dictionary.
 
+        Timestamps may be epoch seconds or, for files written by older
+        versions, ISO 8601 strings.
+
         Parameters
         ----------
         data : dict[str, Any]
@@ -100,11 +157,11 @@ class SessionSnapshot:
         """
         return cls(
             session_id=data["session_id"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
+            created_at=datetime.fromtimestamp(_to_timestamp(data["created_at"])),
+            updated_at=datetime.fromtimestamp(_to_timestamp(data["updated_at"])),
             turn_count=data["turn_count"],
             messages=data["messages"],
-            total_usage=TokenUsage(**data["total_usage"]),
+            total_usage=TokenUsage.from_dict(data["total_usage"]),
         )
 
 
@@ -113,12 +170,13 @@ class PersistenceManager:
     Manages session persistence and checkpoints.
 
     This class provides functionality to save and load agent sessions
-    and create checkpoints for recovery.
+    and create checkpoints for recovery. Session metadata is kept in a
+    sidecar index file so listing sessions does not decode every snapshot.
 
     Examples
     --------
     >>> manager = PersistenceManager()
-    >>> manager.save_session(snapshot)
+    >>> await manager.save_session(snapshot)
     >>> snapshot = manager.load_session("session_id")
     """
 
@@ -130,11 +188,140 @@ class PersistenceManager:
         self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
         os.chmod(self.sessions_dir, 0o700)
         os.chmod(self.checkpoints_dir, 0o700)
+        self.index_path: Path = self.data_dir / "sessions_index.json"
+        self._index: dict[str, dict[str, Any]] | None = None
 
-    def save_session(self, snapshot: SessionSnapshot) -> None:
+    @staticmethod
+    def _session_metadata(data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract the listing metadata from a serialized snapshot.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Serialized session snapshot.
+
+        Returns
+        -------
+        dict[str, Any]
+            Session ID, timestamps (epoch seconds), and turn count.
+        """
+        return {
+            "session_id": data["session_id"],
+            "created_at": _to_timestamp(data["created_at"]),
+            "updated_at": _to_timestamp(data["updated_at"]),
+            "turn_count": data["turn_count"],
+        }
+
+    def _write_index(self, index: dict[str, dict[str, Any]]) -> None:
+        """
+        Atomically rewrite the sessions index file.
+
+        Parameters
+        ----------
+        index : dict[str, dict[str, Any]]
+            Session metadata keyed by session ID.
+        """
+        _write_atomic(self.index_path, orjson.dumps(index))
+
+    def _rebuild_index(self) -> dict[str, dict[str, Any]]:
+        """
+        Rebuild the sessions index by scanning all saved sessions.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Session metadata keyed by session ID.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        with os.scandir(self.sessions_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                try:
+                    with open(entry.path, "rb") as fp:
+                        data: dict[str, Any] = orjson.loads(fp.read())
+                    index[data["session_id"]] = self._session_metadata(data)
+                except Exception as e:
+                    logger.warning(f"Failed to load session from {entry.path}: {e}")
+
+        self._write_index(index)
+        logger.debug(f"Rebuilt sessions index ({len(index)} sessions)")
+        return index
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        """
+        Load the sessions index, rebuilding it if missing or corrupt.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Session metadata keyed by session ID.
+        """
+        if self._index is not None:
+            return self._index
+
+        index: dict[str, dict[str, Any]]
+        try:
+            with open(self.index_path, "rb") as fp:
+                loaded: Any = orjson.loads(fp.read())
+            if not isinstance(loaded, dict):
+                raise ValueError("sessions index is not a JSON object")
+        except FileNotFoundError:
+            index = self._rebuild_index()
+        except Exception as e:
+            logger.warning(f"Rebuilding corrupt sessions index {self.index_path}: {e}")
+            index = self._rebuild_index()
+        else:
+            index = self._drop_missing_sessions(loaded)
+
+        self._index = index
+        return index
+
+    def _drop_missing_sessions(
+        self,
+        index: dict[str, dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Remove index entries whose session file no longer exists.
+
+        One directory scan covers every entry, instead of a stat per
+        session. The index file is rewritten only if entries were dropped.
+
+        Parameters
+        ----------
+        index : dict[str, dict[str, Any]]
+            Session metadata keyed by session ID, as read from disk.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Entries that have a session file.
+        """
+        with os.scandir(self.sessions_dir) as it:
+            names: set[str] = {entry.name for entry in it}
+
+        present: dict[str, dict[str, Any]] = {
+            session_id: metadata
+            for session_id, metadata in index.items()
+            if f"{session_id}.json" in names
+        }
+        if len(present) != len(index):
+            logger.debug(
+                f"Dropped {len(index) - len(present)} missing sessions from the index"
+            )
+            self._write_index(present)
+        return present
+
+    async def save_session(self, snapshot: SessionSnapshot) -> None:
         """
         Save a session snapshot.
 
+        Encoding happens on the calling thread; the blocking file writes
+        and fsync run in a worker thread so the event loop is not stalled.
+        The sessions index is only updated once the session file has been
+        written.
+
         Parameters
         ----------
         snapshot : SessionSnapshot
@@ -142,14 +329,20 @@ class PersistenceManager:
 
         Examples
         --------
-        >>> manager.save_session(snapshot)
+        >>> await manager.save_session(snapshot)
         """
         file_path: Path = self.sessions_dir / f"{snapshot.session_id}.json"
+        data: dict[str, Any] = snapshot.to_dict()
 
-        with open(file_path, "w", encoding="utf-8") as fp:
-            json.dump(snapshot.to_dict(), fp, indent=2)
+        index: dict[str, dict[str, Any]] = self._load_index()
 
-        os.chmod(file_path, 0o600)
+        await asyncio.to_thread(
+            _write_atomic,
+            file_path,
+            orjson.dumps(data, option=orjson.OPT_INDENT_2),
+        )
+        index[snapshot.session_id] = self._session_metadata(data)
+        await asyncio.to_thread(_write_atomic, self.index_path, orjson.dumps(index))
         logger.debug(f"Saved session: {snapshot.session_id}")
 
     def load_session(self, session_id: str) -> SessionSnapshot | None:
@@ -176,17 +369,25 @@ class PersistenceManager:
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as fp:
-                data: dict[str, Any] = json.load(fp)
+            with open(file_path, "rb") as fp:
+                data: dict[str, Any] = orjson.loads(fp.read())
 
             return SessionSnapshot.from_dict(data)
         except Exception as e:
             logger.warning(f"Failed to load session {session_id}: {e}")
             return None
 
-    def list_sessions(self) -> list[dict[str, Any]]:
+    def list_sessions(self, limit: int | None = None) -> list[dict[str, Any]]:
         """
-        List all saved sessions.
+        List saved sessions, most recently updated first.
+
+        Reads the sessions index rather than every snapshot file.
+
+        Parameters
+        ----------
+        limit : int | None, optional
+            Maximum number of sessions to return. All sessions are
+            returned when omitted.
 
         Returns
         -------
@@ -195,33 +396,27 @@ class PersistenceManager:
 
         Examples
         --------
-        >>> sessions = manager.list_sessions()
+        >>> sessions = manager.list_sessions(limit=20)
         >>> for session in sessions:
         ...     print(f"{session['session_id']}: {session['turn_count']} turns")
         """
-        sessions: list[dict[str, Any]] = []
-        for file_path in self.sessions_dir.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as fp:
-                    data: dict[str, Any] = json.load(fp)
-                sessions.append(
-                    {
-                        "session_id": data["session_id"],
-                        "created_at": data["created_at"],
-                        "updated_at": data["updated_at"],
-                        "turn_count": data["turn_count"],
-                    },
-                )
-            except Exception as e:
-                logger.warning(f"Failed to load session from {file_path}: {e}")
-
-        sessions.sort(key=lambda x: x["updated_at"], reverse=True)
-        return sessions
-
-    def save_checkpoint(self, snapshot: SessionSnapshot) -> str:
+        sessions = self._load_index().values()
+
+        def sort_key(x: dict[str, Any]) -> float:
+            updated_at: float = x["updated_at"]
+            return updated_at
+
+        if limit is not None:
+            return heapq.nlargest(limit, sessions, key=sort_key)
+
+        return sorted(sessions, key=sort_key, reverse=True)
+
+    async def save_checkpoint(self, snapshot: SessionSnapshot) -> str:
         """
         Save a checkpoint of a session.
 
+        The blocking file write and fsync run in a worker thread.
+
         Parameters
         ----------
         snapshot : SessionSnapshot
@@ -234,15 +429,17 @@ class PersistenceManager:
 
         Examples
         --------
-        >>> checkpoint_id = manager.save_checkpoint(snapshot)
+        >>> checkpoint_id = await manager.save_checkpoint(snapshot)
         """
         timestamp: str = datetime.now().strftime("%Y%m%d_%H%M%S")
         checkpoint_id: str = f"{snapshot.session_id}_{timestamp}"
         file_path: Path = self.checkpoints_dir / f"{checkpoint_id}.json"
 
-        with open(file_path, "w", encoding="utf-8") as fp:
-            json.dump(snapshot.to_dict(), fp, indent=2)
-        os.chmod(file_path, 0o600)
+        await asyncio.to_thread(
+            _write_atomic,
+            file_path,
+            orjson.dumps(snapshot.to_dict(), option=orjson.OPT_INDENT_2),
+        )
         logger.debug(f"Saved checkpoint: {checkpoint_id}")
         return checkpoint_id
 
@@ -270,8 +467,8 @@ class PersistenceManager:
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as fp:
-                data: dict[str, Any] = json.load(fp)
+            with open(file_path, "rb") as fp:
+                data: dict[str, Any] = orjson.loads(fp.read())
 
             return SessionSnapshot.from_dict(data)
         except Exception as e:
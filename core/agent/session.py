@@ -6,12 +6,18 @@ initialization, tool registry setup, context management, and
 session statistics.
 """
 
-import json
+import asyncio
 import logging
+import os
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+import orjson
+
 from core.config.loader import get_data_dir
 from core.config.schema import Configuration
 from core.context.compaction import ChatCompactor
@@ -20,15 +26,72 @@ from core.context.manager import ContextManager
 from core.hooks.system import HookSystem
 from core.llm.client import LLMClient
 from core.safety.approval import ApprovalManager
+from core.tools.builtin import get_all_builtin_tools
 from core.tools.discovery import ToolDiscoveryManager
 from core.tools.mcp.manager import MCPManager
 from core.tools.registry import ToolRegistry
-from core.tools.builtin import get_all_builtin_tools
 from core.tools.subagents.definitions import get_default_subagent_definitions
 from core.tools.subagents.tool import SubagentTool
 
 logger = logging.getLogger(__name__)
 
+_MEMORY_CACHE_MAX_ENTRIES: int = 8
+_memory_cache: OrderedDict[tuple[str, int, int], str | None] = OrderedDict()
+_memory_cache_lock: threading.Lock = threading.Lock()
+
+
+def _load_memory_from_path(path: Path) -> str | None:
+    """
+    Load and format a user memory file, reusing the last parse if unchanged.
+
+    Parsed results are cached by path, modification time, and size, so
+    repeated sessions only stat the file until it is edited.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the user memory JSON file.
+
+    Returns
+    -------
+    str | None
+        Formatted memory string if the file has entries, None otherwise.
+
+    Examples
+    --------
+    >>> memory = _load_memory_from_path(get_data_dir() / "user_memory.json")
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    key: tuple[str, int, int] = (str(path), st.st_mtime_ns, st.st_size)
+    with _memory_cache_lock:
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)
+            return _memory_cache[key]
+
+    try:
+        data: dict[str, Any] = orjson.loads(path.read_bytes())
+        entries = data.get("entries")
+        memory: str | None = (
+            "User preferences and notes:\n"
+            + "\n".join([f"- {name}: {value}" for name, value in entries.items()])
+            if entries
+            else None
+        )
+    except Exception as e:
+        logger.warning("Failed to load user memory: %s", e)
+        return None
+
+    with _memory_cache_lock:
+        _memory_cache[key] = memory
+        while len(_memory_cache) > _MEMORY_CACHE_MAX_ENTRIES:
+            _memory_cache.popitem(last=False)
+
+    return memory
+
 
 def create_default_registry(config: Configuration) -> ToolRegistry:
     """
@@ -51,12 +114,13 @@ def create_default_registry(config: Configuration) -> ToolRegistry:
     from core.tools.registry import ToolRegistry
 
     registry = ToolRegistry(config)
-
-    for tool_class in get_all_builtin_tools():
-        registry.register(tool_class(config))
-
-    for subagent_def in get_default_subagent_definitions():
-        registry.register(SubagentTool(config, subagent_def))
+    registry.register_many(
+        [tool_class(config) for tool_class in get_all_builtin_tools()]
+        + [
+            SubagentTool(config, subagent_def)
+            for subagent_def in get_default_subagent_definitions()
+        ],
+    )
 
     return registry
 
@@ -128,33 +192,70 @@ class Session:
         )
         self.loop_detector: LoopDetector = LoopDetector()
         self.hook_system: HookSystem = HookSystem(config)
-        self.session_id: str = str(uuid.uuid4())
-        self.created_at: datetime = datetime.now()
-        self.updated_at: datetime = datetime.now()
+        self.session_id: str = uuid.uuid4().hex
+        now: datetime = datetime.now()
+        self.created_at = now
+        self.updated_at: datetime = now
 
         self.turn_count: int = 0
 
+    @property
+    def created_at(self) -> datetime:
+        """
+        Get the session creation timestamp.
+
+        Returns
+        -------
+        datetime
+            Session creation timestamp.
+        """
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        """
+        Set the session creation timestamp, e.g. when restoring a session.
+
+        The ISO form used by ``get_stats`` is computed here once.
+
+        Parameters
+        ----------
+        value : datetime
+            New creation timestamp.
+        """
+        self._created_at: datetime = value
+        self._created_at_iso: str = value.isoformat()
+
     async def initialize(self) -> None:
         """
         Initialize the session.
 
         This method initializes MCP servers, discovers custom tools,
-        and sets up the context manager.
+        and sets up the context manager. MCP startup, loading custom
+        tools, and the user memory read are independent, so they run
+        concurrently; the filesystem work runs in worker threads. Tools
+        are registered once all three finish.
 
         Examples
         --------
         >>> await session.initialize()
         """
-        await self.mcp_manager.initialize()
+        # Only the I/O overlaps. Registration happens afterwards in a fixed
+        # order (discovered tools, then MCP tools), whatever finishes first.
+        _, discovered, user_memory = await asyncio.gather(
+            self.mcp_manager.initialize(),
+            asyncio.to_thread(self.discovery_manager.load_all),
+            asyncio.to_thread(self._load_memory),
+        )
+        self.discovery_manager.register(discovered)
         self.mcp_manager.register_tools(self.tool_registry)
 
-        self.discovery_manager.discover_all()
         self.context_manager = ContextManager(
             config=self.config,
-            user_memory=self._load_memory(),
+            user_memory=user_memory,
             tools=self.tool_registry.get_schemas(),
         )
-        logger.info(f"Session {self.session_id} initialized")
+        logger.info("Session %s initialized", self.session_id)
 
     def _load_memory(self) -> str | None:
         """
@@ -165,28 +266,24 @@ class Session:
         str | None
             Formatted memory string if found, None otherwise.
         """
-        data_dir: Path = get_data_dir()
-        data_dir.mkdir(parents=True, exist_ok=True)
-        path: Path = data_dir / "user_memory.json"
+        # Read-only: the data directory is created by the memory tool on save.
+        return _load_memory_from_path(get_data_dir() / "user_memory.json")
 
-        if not path.exists():
-            return None
-
-        try:
-            content: str = path.read_text(encoding="utf-8")
-            data: dict[str, Any] = json.loads(content)
-            entries = data.get("entries")
-            if not entries:
-                return None
+    @property
+    def cached_tool_schemas(self) -> list[dict[str, Any]] | None:
+        """
+        Get the tool schemas to send with each chat completion.
 
-            lines: list[str] = ["User preferences and notes:"]
-            for key, value in entries.items():
-                lines.append(f"- {key}: {value}")
+        Returns
+        -------
+        list[dict[str, Any]] | None
+            Cached registry schemas, or None when no tools are available.
 
-            return "\n".join(lines)
-        except Exception as e:
-            logger.warning(f"Failed to load user memory: {e}")
-            return None
+        Examples
+        --------
+        >>> tools = session.cached_tool_schemas
+        """
+        return self.tool_registry.get_schemas() or None
 
     def increment_turn(self) -> int:
         """
@@ -222,7 +319,7 @@ class Session:
         """
         return {
             "session_id": self.session_id,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self._created_at_iso,
             "updated_at": self.updated_at.isoformat(),
             "turn_count": self.turn_count,
             "message_count": (
@@ -231,10 +328,11 @@ class Session:
                 else 0
             ),
             "token_usage": (
-                self.context_manager.total_usage.model_dump()
+                self.context_manager.total_usage.to_dict()
                 if self.context_manager
                 else {}
             ),
-            "tools_count": len(self.tool_registry.get_tools()),
+            # The cached schema list has one entry per available tool.
+            "tools_count": len(self.tool_registry.get_schemas()),
             "mcp_servers": len(self.tool_registry.connected_mcp_servers),
         }
@@ -7,19 +7,15 @@ multiple sources including system-wide and project-specific configuration files.
 
 import logging
 import os
+import threading
+import tomllib
+from collections import OrderedDict
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from platformdirs import user_config_dir, user_data_dir
 
-try:
-    import tomli
-except ImportError:
-    try:
-        import tomllib as tomli  # Python 3.11+
-    except ImportError:
-        tomli = None  # type: ignore[assignment,unused-ignore]
-
 from core.config.schema import Configuration
 from core.constants import (
     AGENT_MD_FILE_NAME,
@@ -32,11 +28,22 @@ from core.exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Environment variables read by load_configuration; part of the cache key.
+_CONFIG_ENV_VARS: tuple[str, ...] = ("DRIFT_PROVIDER", "BASE_URL", "API_KEY")
+_CONFIG_CACHE_MAX_ENTRIES: int = 32
+# Dumps of already validated configurations, keyed by their sources.
+_config_cache: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
+_config_cache_lock: threading.Lock = threading.Lock()
+
 
+@cache
 def get_config_dir() -> Path:
     """
     Get the system-wide configuration directory.
 
+    The result is computed once per process; call
+    ``get_config_dir.cache_clear()`` after changing the XDG environment.
+
     Returns
     -------
     Path
@@ -50,10 +57,14 @@ def get_config_dir() -> Path:
     return Path(user_config_dir(APP_NAME))
 
 
+@cache
 def get_data_dir() -> Path:
     """
     Get the system-wide data directory.
 
+    The result is computed once per process; call
+    ``get_data_dir.cache_clear()`` after changing the XDG environment.
+
     Returns
     -------
     Path
@@ -108,17 +119,11 @@ def _parse_toml(path: Path) -> dict[str, Any]:
     --------
     >>> config_dict = _parse_toml(Path("config.toml"))
     """
-    if tomli is None:
-        raise ConfigurationError(
-            "TOML parsing not available. Install 'tomli' package.",
-            config_file=str(path),
-        )
-
     try:
-        with open(path, "rb") as f:
-            return tomli.load(f)
+        # Config files are small: one read syscall, then parse the string.
+        return tomllib.loads(path.read_bytes().decode(DEFAULT_ENCODING))
     except Exception as e:
-        if isinstance(e, (tomli.TOMLDecodeError, ValueError)):  # type: ignore[attr-defined]
+        if isinstance(e, (tomllib.TOMLDecodeError, ValueError)):
             raise ConfigurationError(
                 f"Invalid TOML in {path}: {e}",
                 config_file=str(path),
@@ -141,7 +146,7 @@ def _get_project_config(cwd: Path) -> Path | None:
     Parameters
     ----------
     cwd : Path
-        Current working directory to search from.
+        Current working directory to search from, already resolved.
 
     Returns
     -------
@@ -154,13 +159,10 @@ def _get_project_config(cwd: Path) -> Path | None:
     >>> if project_config:
     ...     print(f"Found project config: {project_config}")
     """
-    current: Path = cwd.resolve()
-    agent_dir: Path = current / CONFIG_DIR_NAME
-
-    if agent_dir.is_dir():
-        config_file: Path = agent_dir / CONFIG_FILE_NAME
-        if config_file.is_file():
-            return config_file
+    # A single stat: the file cannot exist without its directory.
+    config_file: Path = cwd / CONFIG_DIR_NAME / CONFIG_FILE_NAME
+    if config_file.is_file():
+        return config_file
 
     return None
 
@@ -172,7 +174,7 @@ def _get_agent_md_content(cwd: Path) -> str | None:
     Parameters
     ----------
     cwd : Path
-        Current working directory to search from.
+        Current working directory to search from, already resolved.
 
     Returns
     -------
@@ -185,41 +187,44 @@ def _get_agent_md_content(cwd: Path) -> str | None:
     >>> if content:
     ...     print("Found AGENT.MD instructions")
     """
-    current: Path = cwd.resolve()
-
-    if current.is_dir():
-        agent_md_file: Path = current / AGENT_MD_FILE_NAME
-        if agent_md_file.is_file():
-            try:
-                return agent_md_file.read_text(encoding=DEFAULT_ENCODING)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to read {agent_md_file}: {e}",
-                    exc_info=True,
-                )
-                return None
+    agent_md_file: Path = cwd / AGENT_MD_FILE_NAME
 
-    return None
+    # Open directly instead of checking first; a missing file is the
+    # common case and costs a single failed open.
+    try:
+        return agent_md_file.read_text(encoding=DEFAULT_ENCODING)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    except Exception as e:
+        logger.warning(
+            "Failed to read %s: %s",
+            agent_md_file,
+            e,
+            exc_info=True,
+        )
+        return None
 
 
 def _merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """
-    Recursively merge two dictionaries.
+    Recursively merge one dictionary into another, in place.
 
     Values from `override` take precedence over `base`. Nested dictionaries
-    are merged recursively.
+    are merged recursively. `base` is modified and returned; values from
+    `override` are inserted without copying, so both arguments should be
+    freshly parsed data that is not shared elsewhere.
 
     Parameters
     ----------
     base : dict[str, Any]
-        Base dictionary to merge into.
+        Base dictionary to merge into (modified in place).
     override : dict[str, Any]
         Dictionary with values that override base.
 
     Returns
     -------
     dict[str, Any]
-        Merged dictionary.
+        The merged `base` dictionary.
 
     Examples
     --------
@@ -228,29 +233,86 @@ def _merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str, An
     >>> merged = _merge_dicts(base, override)
     >>> # Result: {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
     """
-    result: dict[str, Any] = base.copy()
     for key, value in override.items():
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(value, dict)
-        ):
-            result[key] = _merge_dicts(result[key], value)
+        existing = base.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            _merge_dicts(existing, value)
         else:
-            result[key] = value
+            base[key] = value
+
+    return base
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """
+    Get a change fingerprint for a file.
+
+    Parameters
+    ----------
+    path : Path
+        File to stat.
+
+    Returns
+    -------
+    tuple[int, int] | None
+        Modification time in nanoseconds and size, or None if the file
+        does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _configuration_cache_key(cwd: Path) -> tuple[Any, ...]:
+    """
+    Build the cache key for configuration loaded from a directory.
+
+    The key covers every input of ``load_configuration``: the directory,
+    the system and project config files, AGENT.MD, and the environment
+    variables that override API settings.
+
+    Parameters
+    ----------
+    cwd : Path
+        Resolved working directory configuration is loaded for.
+
+    Returns
+    -------
+    tuple[Any, ...]
+        Hashable fingerprint of the configuration sources.
+    """
+    return (
+        str(cwd),
+        _stat_key(get_system_config_path()),
+        _stat_key(cwd / CONFIG_DIR_NAME / CONFIG_FILE_NAME),
+        _stat_key(cwd / AGENT_MD_FILE_NAME),
+        tuple(os.environ.get(name) for name in _CONFIG_ENV_VARS),
+    )
+
 
-    return result
+def clear_configuration_cache() -> None:
+    """
+    Drop all cached configurations.
+
+    Examples
+    --------
+    >>> clear_configuration_cache()
+    >>> config = load_configuration()  # Re-reads all sources
+    """
+    with _config_cache_lock:
+        _config_cache.clear()
 
 
 def load_configuration(cwd: Path | None = None) -> Configuration:
     """
     Load configuration from system and project sources.
 
-    This function loads configuration in the following order:
-    1. System-wide configuration (if exists)
-    2. Project-specific configuration (if exists, overrides system)
-    3. AGENT.MD file content (if exists, added as developer_instructions)
-    4. Environment variables (for API key, base URL, etc.)
+    Results are cached per working directory and invalidated when any
+    configuration file, AGENT.MD, or a relevant environment variable
+    changes. Each call returns an independent copy, so callers may mutate
+    the result freely.
 
     Parameters
     ----------
@@ -274,7 +336,59 @@ def load_configuration(cwd: Path | None = None) -> Configuration:
     >>> # Load from specific directory
     >>> config = load_configuration(Path("/path/to/project"))
     """
-    cwd = cwd or Path.cwd()
+    # Resolve once; the helpers below all expect a resolved path.
+    cwd = (cwd or Path.cwd()).resolve()
+    key: tuple[Any, ...] = _configuration_cache_key(cwd)
+
+    with _config_cache_lock:
+        cached: dict[str, Any] | None = _config_cache.get(key)
+        if cached is not None:
+            _config_cache.move_to_end(key)
+
+    if cached is not None:
+        # The dump was produced from a validated configuration, so this
+        # cannot fail. Re-validating in pydantic-core is cheaper than
+        # model_construct for the nested models or a deep copy, and it
+        # builds fresh containers, so the cached dump is never shared.
+        return Configuration.model_validate(cached)
+
+    config: Configuration = _load_configuration_uncached(cwd)
+    dump: dict[str, Any] = config.model_dump()
+
+    with _config_cache_lock:
+        _config_cache[key] = dump
+        _config_cache.move_to_end(key)
+        while len(_config_cache) > _CONFIG_CACHE_MAX_ENTRIES:
+            _config_cache.popitem(last=False)
+
+    return config
+
+
+def _load_configuration_uncached(cwd: Path) -> Configuration:
+    """
+    Load configuration from system and project sources, bypassing the cache.
+
+    This function loads configuration in the following order:
+    1. System-wide configuration (if exists)
+    2. Project-specific configuration (if exists, overrides system)
+    3. AGENT.MD file content (if exists, added as developer_instructions)
+    4. Environment variables (for API key, base URL, etc.)
+
+    Parameters
+    ----------
+    cwd : Path
+        Resolved current working directory.
+
+    Returns
+    -------
+    Configuration
+        Loaded and validated configuration object.
+
+    Raises
+    ------
+    ConfigurationError
+        If configuration loading or validation fails.
+    """
     system_path: Path = get_system_config_path()
 
     config_dict: dict[str, Any] = {}
@@ -283,10 +397,12 @@ def load_configuration(cwd: Path | None = None) -> Configuration:
     if system_path.is_file():
         try:
             config_dict = _parse_toml(system_path)
-            logger.debug(f"Loaded system config from {system_path}")
+            logger.debug("Loaded system config from %s", system_path)
         except ConfigurationError as e:
             logger.warning(
-                f"Skipping invalid system config {system_path}: {e}",
+                "Skipping invalid system config %s: %s",
+                system_path,
+                e,
             )
 
     # Load project-specific configuration (overrides system)
@@ -295,10 +411,12 @@ def load_configuration(cwd: Path | None = None) -> Configuration:
         try:
             project_config_dict: dict[str, Any] = _parse_toml(project_path)
             config_dict = _merge_dicts(config_dict, project_config_dict)
-            logger.debug(f"Loaded project config from {project_path}")
+            logger.debug("Loaded project config from %s", project_path)
         except ConfigurationError as e:
             logger.warning(
-                f"Skipping invalid project config {project_path}: {e}",
+                "Skipping invalid project config %s: %s",
+                project_path,
+                e,
             )
 
     # Set working directory if not already set
@@ -310,7 +428,7 @@ def load_configuration(cwd: Path | None = None) -> Configuration:
         agent_md_content: str | None = _get_agent_md_content(cwd)
         if agent_md_content:
             config_dict["developer_instructions"] = agent_md_content
-            logger.debug(f"Loaded AGENT.MD from {cwd}")
+            logger.debug("Loaded AGENT.MD from %s", cwd)
 
     # Handle environment variables for API configuration
     # These override config file settings
@@ -334,7 +452,7 @@ def load_configuration(cwd: Path | None = None) -> Configuration:
 
     # Create and validate configuration
     try:
-        config: Configuration = Configuration(**config_dict)
+        config: Configuration = Configuration.model_validate(config_dict)
     except Exception as e:
         raise ConfigurationError(
             f"Invalid configuration: {e}",
@@ -349,5 +467,5 @@ def load_configuration(cwd: Path | None = None) -> Configuration:
         )
         raise ConfigurationError(error_msg)
 
-    logger.info(f"Configuration loaded successfully from {cwd}")
+    logger.info("Configuration loaded successfully from %s", cwd)
     return config
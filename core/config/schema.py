@@ -8,13 +8,17 @@ configurations, and approval policies.
 
 from __future__ import annotations
 
+import fnmatch
 import os
-from enum import Enum
+import re
+from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from core.constants import DEFAULT_STREAM_FLUSH_INTERVAL
 from core.exceptions import ValidationError
 
 
@@ -50,36 +54,8 @@ class ModelConfig(BaseModel):
         description="Maximum context window size in tokens",
     )
 
-    @field_validator("temperature")
-    @classmethod
-    def validate_temperature(cls, v: float) -> float:
-        """
-        Validate temperature is within acceptable range.
-
-        Parameters
-        ----------
-        v : float
-            Temperature value to validate.
-
-        Returns
-        -------
-        float
-            Validated temperature value.
-
-        Raises
-        ------
-        ValidationError
-            If temperature is outside the valid range.
-        """
-        if not 0.0 <= v <= 2.0:
-            raise ValidationError(
-                f"Temperature must be between 0.0 and 2.0, got {v}",
-                field="temperature",
-            )
-        return v
-
 
-class LLMProvider(str, Enum):
+class LLMProvider(StrEnum):
     """LLM provider options."""
 
     OPENAI = "openai"
@@ -149,6 +125,35 @@ class APIConfig(BaseModel):
         return self
 
 
+@lru_cache(maxsize=32)
+def _compile_exclude_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Compile shell-style exclude patterns into one case-insensitive regex.
+
+    Parameters
+    ----------
+    patterns : tuple[str, ...]
+        Glob patterns as accepted by ``fnmatch``.
+
+    Returns
+    -------
+    re.Pattern[str] | None
+        Pattern matching upper-cased names that match any of the globs,
+        or None if there are no patterns.
+
+    Examples
+    --------
+    >>> regex = _compile_exclude_patterns(("*KEY*", "*TOKEN*"))
+    >>> bool(regex.match("API_KEY"))
+    True
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(pattern.upper()) for pattern in patterns),
+    )
+
+
 class ShellEnvironmentPolicy(BaseModel):
     """
     Policy for shell environment variable handling.
@@ -183,6 +188,28 @@ class ShellEnvironmentPolicy(BaseModel):
         description="Environment variables to set",
     )
 
+    @property
+    def exclude_regex(self) -> re.Pattern[str] | None:
+        """
+        Get the exclude patterns compiled into a single regex.
+
+        The regex is compiled once per distinct pattern list and matches
+        upper-cased variable names, mirroring a case-insensitive
+        ``fnmatch`` against each pattern.
+
+        Returns
+        -------
+        re.Pattern[str] | None
+            Combined pattern, or None if no patterns are configured.
+
+        Examples
+        --------
+        >>> policy = ShellEnvironmentPolicy()
+        >>> bool(policy.exclude_regex.match("GITHUB_TOKEN"))
+        True
+        """
+        return _compile_exclude_patterns(tuple(self.exclude_patterns))
+
 
 class MCPServerConfig(BaseModel):
     """
@@ -223,6 +250,9 @@ class MCPServerConfig(BaseModel):
     >>> server = MCPServerConfig(url="https://api.example.com/mcp")
     """
 
+    # Server definitions are read-only once loaded.
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = Field(default=True, description="Whether server is enabled")
     startup_timeout_sec: float = Field(
         default=10.0,
@@ -287,7 +317,7 @@ class MCPServerConfig(BaseModel):
         return self
 
 
-class ApprovalPolicy(str, Enum):
+class ApprovalPolicy(StrEnum):
     """Policy for when to require user approval for actions."""
 
     ON_REQUEST = "on-request"
@@ -298,7 +328,7 @@ class ApprovalPolicy(str, Enum):
     YOLO = "yolo"
 
 
-class HookTrigger(str, Enum):
+class HookTrigger(StrEnum):
     """Trigger points for hook execution."""
 
     BEFORE_AGENT = "before_agent"
@@ -322,6 +352,11 @@ class HookConfig(BaseModel):
         Command to execute (e.g., "python3 tests.py").
     script : str | None, optional
         Path to script file to execute (e.g., "*.sh").
+    shell : bool, default=True
+        Run ``command`` through the shell. When False, commands without
+        shell syntax whose program is found on ``PATH`` are executed
+        directly, which skips the shell process. Shell builtins, aliases,
+        and rc files then no longer apply.
     timeout_sec : float, default=30.0
         Maximum execution time in seconds.
     enabled : bool, default=True
@@ -341,6 +376,9 @@ class HookConfig(BaseModel):
     ... )
     """
 
+    # HookSystem groups hooks by trigger once, so they must not change.
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Hook name")
     trigger: HookTrigger = Field(description="When to execute hook")
     command: str | None = Field(
@@ -351,6 +389,10 @@ class HookConfig(BaseModel):
         default=None,
         description="Path to script file",
     )
+    shell: bool = Field(
+        default=True,
+        description="Run command through the shell",
+    )
     timeout_sec: float = Field(
         default=30.0,
         ge=0.0,
@@ -418,6 +460,9 @@ class Configuration(BaseModel):
         Instructions from project developers.
     user_instructions : str | None, optional
         Instructions from the user.
+    flush_interval : float, default=0.005
+        Seconds to coalesce streamed text deltas before emitting them.
+        Set to 0 to emit every delta as it arrives.
     debug : bool, default=False
         Enable debug mode.
 
@@ -480,6 +525,11 @@ class Configuration(BaseModel):
         default=None,
         description="User-provided instructions",
     )
+    flush_interval: float = Field(
+        default=DEFAULT_STREAM_FLUSH_INTERVAL,
+        ge=0.0,
+        description="Seconds to coalesce streamed text deltas (0 disables)",
+    )
     debug: bool = Field(
         default=False,
         description="Enable debug mode",
@@ -593,7 +643,8 @@ class Configuration(BaseModel):
             )
         self.model.temperature = value
 
-    def validate(self) -> list[str]:
+    # Shadows Pydantic's deprecated ``BaseModel.validate`` classmethod.
+    def validate(self) -> list[str]:  # type: ignore[override]
         """
         Validate the configuration and return any errors.
 
@@ -5,7 +5,6 @@ This module defines constants used throughout the application to ensure
 consistency and maintainability.
 """
 
-from pathlib import Path
 
 # Configuration file names
 CONFIG_FILE_NAME: str = "config.toml"
@@ -20,6 +19,11 @@ DEFAULT_MAX_RETRIES: int = 3
 DEFAULT_RETRY_BASE_DELAY: float = 1.0
 DEFAULT_RETRY_MAX_DELAY: float = 60.0
 
+# Streaming
+DEFAULT_STREAM_FLUSH_INTERVAL: float = 0.005
+STREAM_FLUSH_MAX_DELTAS: int = 8
+STREAM_TOOL_ARGS_FLUSH_CHARS: int = 4096
+
 # Token estimation
 DEFAULT_CHARS_PER_TOKEN: int = 4
 MIN_TOKEN_COUNT: int = 1
@@ -10,6 +10,7 @@ import logging
 from typing import Any
 
 from core.context.manager import ContextManager
+from core.context.models import MessageItem
 from core.llm.client import LLMClient
 from core.llm.models import StreamEventType, TokenUsage
 from core.prompts.builder import get_compression_prompt
@@ -17,6 +18,65 @@ from core.types import MessageDict
 
 logger = logging.getLogger(__name__)
 
+# Per-message character limits for the history sent for compaction.
+_TOOL_RESULT_LIMIT: int = 2000
+_ASSISTANT_LIMIT: int = 3000
+_TOOL_ARGS_LIMIT: int = 500
+_USER_LIMIT: int = 1500
+_SECTION_SEPARATOR: str = "\n\n---\n\n"
+
+
+def _truncate(text: str, limit: int, suffix: str) -> str:
+    """
+    Truncate text to a character limit, appending a marker if cut.
+
+    Parameters
+    ----------
+    text : str
+        Text to truncate.
+    limit : int
+        Maximum number of characters to keep.
+    suffix : str
+        Marker appended when the text is truncated.
+
+    Returns
+    -------
+    str
+        The original text if it fits, otherwise its first `limit`
+        characters followed by `suffix`.
+
+    Examples
+    --------
+    >>> _truncate("abcdef", 3, "...")
+    'abc...'
+    """
+    return text if len(text) <= limit else text[:limit] + suffix
+
+
+def _format_tool_call(func: dict[str, Any]) -> str:
+    """
+    Format one assistant tool call as a compaction history line.
+
+    Parameters
+    ----------
+    func : dict[str, Any]
+        The ``function`` entry of an API tool call.
+
+    Returns
+    -------
+    str
+        Line of the form ``"  - name(arguments)"``, with long arguments
+        truncated.
+
+    Examples
+    --------
+    >>> _format_tool_call({"name": "read_file", "arguments": '{"path": "a.py"}'})
+    '  - read_file({"path": "a.py"})'
+    """
+    name: str = func.get("name", "unknown")
+    args: str = func.get("arguments", "{}")
+    return f"  - {name}({_truncate(args, _TOOL_ARGS_LIMIT, '...')})"
+
 
 class ChatCompactor:
     """
@@ -45,15 +105,17 @@ class ChatCompactor:
 
     def _format_history_for_compaction(
         self,
-        messages: list[MessageDict],
+        messages: list[MessageItem],
     ) -> str:
         """
         Format conversation history for compression.
 
         Parameters
         ----------
-        messages : list[MessageDict]
-            List of messages to format.
+        messages : list[MessageItem]
+            Conversation messages to format, as stored by the context
+            manager. Attributes are read directly instead of looking up
+            keys in the API dictionaries.
 
         Returns
         -------
@@ -64,52 +126,60 @@ class ChatCompactor:
         --------
         >>> formatted = compactor._format_history_for_compaction(messages)
         """
+        # Pieces are appended as-is and joined once at the end, so message
+        # content is copied only into the final string rather than first
+        # into a per-section f-string.
         output: list[str] = ["Here is the conversation that needs to be continued:\n"]
+        write = output.append
 
         for msg in messages:
-            role: str = msg.get("role", "")
-            content: str = msg.get("content", "")
-
+            role: str = msg.role
             if role == "system":
                 continue
 
-            if role == "tool":
-                tool_id: str = msg.get("tool_call_id", "unknown")
-
-                truncated: str = content[:2000] if len(content) > 2000 else content
-                if len(content) > 2000:
-                    truncated += "\n... [tool output truncated]"
+            content: str = msg.content
 
-                output.append(f"[Tool Result ({tool_id})]:\n{truncated}")
+            if role == "tool":
+                write(_SECTION_SEPARATOR)
+                write(f"[Tool Result ({msg.tool_call_id or 'unknown'})]:\n")
+                write(
+                    _truncate(
+                        content,
+                        _TOOL_RESULT_LIMIT,
+                        "\n... [tool output truncated]",
+                    ),
+                )
             elif role == "assistant":
-                tool_details: list[str] = []
                 if content:
-                    truncated = content[:3000] if len(content) > 3000 else content
-                    if len(content) > 3000:
-                        truncated += "\n... [response truncated]"
-                    output.append(f"Assistant:\n{truncated}")
-
-                if msg.get("tool_calls"):
-                    for tc in msg["tool_calls"]:
-                        func = tc.get("function", {})
-                        name: str = func.get("name", "unknown")
-                        args: str = func.get("arguments", "{}")
-
-                        if len(args) > 500:
-                            args = args[:500] + "..."
-                        tool_details.append(f"  - {name}({args})")
-
-                    if tool_details:
-                        output.append(
-                            "Assistant called tools:\n" + "\n".join(tool_details),
-                        )
+                    write(_SECTION_SEPARATOR)
+                    write("Assistant:\n")
+                    write(
+                        _truncate(
+                            content,
+                            _ASSISTANT_LIMIT,
+                            "\n... [response truncated]",
+                        ),
+                    )
+
+                tool_calls: list[dict[str, Any]] = msg.tool_calls
+                if tool_calls:
+                    write(_SECTION_SEPARATOR)
+                    write("Assistant called tools:")
+                    for tc in tool_calls:
+                        write("\n")
+                        write(_format_tool_call(tc.get("function", {})))
             else:
-                truncated = content[:1500] if len(content) > 1500 else content
-                if len(content) > 1500:
-                    truncated += "\n... [message truncated]"
-                output.append(f"User:\n{truncated}")
-
-        return "\n\n---\n\n".join(output)
+                write(_SECTION_SEPARATOR)
+                write("User:\n")
+                write(
+                    _truncate(
+                        content,
+                        _USER_LIMIT,
+                        "\n... [message truncated]",
+                    ),
+                )
+
+        return "".join(output)
 
     async def compress(
         self,
@@ -148,7 +218,9 @@ class ChatCompactor:
             },
             {
                 "role": "user",
-                "content": self._format_history_for_compaction(messages),
+                "content": self._format_history_for_compaction(
+                    context_manager.get_history(),
+                ),
             },
         ]
 
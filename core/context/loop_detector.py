@@ -7,6 +7,7 @@ conversation quality.
 """
 
 import logging
+import sys
 from collections import deque
 from typing import Any
 
@@ -35,6 +36,10 @@ class LoopDetector:
         Maximum cycle length to detect.
     _history : deque[str]
         History of action signatures.
+    _hashes : deque[int]
+        Hashes of the signatures in ``_history``, in the same order.
+    _sorted_keys : dict[tuple[str, ...], tuple[str, ...]]
+        Sorted argument names keyed by the order the arguments arrived in.
 
     Examples
     --------
@@ -53,6 +58,8 @@ class LoopDetector:
         self.max_exact_repeats: int = max_exact_repeats
         self.max_cycle_length: int = max_cycle_length
         self._history: deque[str] = deque(maxlen=20)
+        self._hashes: deque[int] = deque(maxlen=20)
+        self._sorted_keys: dict[tuple[str, ...], tuple[str, ...]] = {}
 
     def record_action(self, action_type: str, **details: Any) -> None:
         """
@@ -73,20 +80,31 @@ class LoopDetector:
         ...     args={"path": "main.py"}
         ... )
         """
-        output: list[str] = [action_type]
-
         if action_type == "tool_call":
-            output.append(details.get("tool_name", ""))
+            # Tool names and argument sets repeat constantly, which is what
+            # this class looks for: intern the names and sort each distinct
+            # argument ordering only once.
+            tool_name: str = sys.intern(details.get("tool_name", ""))
             args = details.get("args", {})
 
-            if isinstance(args, dict):
-                for k in sorted(args.keys()):
-                    output.append(f"{k}={str(args[k])}")
+            if isinstance(args, dict) and args:
+                order: tuple[str, ...] = tuple(args)
+                keys: tuple[str, ...] | None = self._sorted_keys.get(order)
+                if keys is None:
+                    keys = tuple(sorted(map(sys.intern, order)))
+                    self._sorted_keys[order] = keys
+                signature: str = "|".join(
+                    [action_type, tool_name, *[f"{k}={args[k]}" for k in keys]],
+                )
+            else:
+                signature = f"{action_type}|{tool_name}"
         elif action_type == "response":
-            output.append(details.get("text", ""))
+            signature = f"{action_type}|{details.get('text', '')}"
+        else:
+            signature = action_type
 
-        signature: str = "|".join(output)
         self._history.append(signature)
+        self._hashes.append(hash(signature))
         logger.debug(f"Recorded action: {signature}")
 
     def check_for_loop(self) -> str | None:
@@ -107,24 +125,35 @@ class LoopDetector:
         if len(self._history) < 2:
             return None
 
+        # Detection runs inline every turn. The deques are indexed in place
+        # (indexing near either end is O(1)) rather than copied. Candidates
+        # are compared by their precomputed hashes first; the signatures
+        # themselves, which can be long, are only compared on a hash match.
+        history: deque[str] = self._history
+        hashes: deque[int] = self._hashes
+
         # Check for exact repeats
-        if len(self._history) >= self.max_exact_repeats:
-            recent: list[str] = list(self._history)[-self.max_exact_repeats :]
-            if len(set(recent)) == 1:
+        if len(history) >= self.max_exact_repeats:
+            last_hash: int = hashes[-1]
+            last: str = history[-1]
+            if all(
+                hashes[i] == last_hash and history[i] == last
+                for i in range(-self.max_exact_repeats, -1)
+            ):
                 return (
-                    f"Same action repeated {self.max_exact_repeats} times: {recent[0]}"
+                    f"Same action repeated {self.max_exact_repeats} times: {last}"
                 )
 
         # Check for cycles
-        if len(self._history) >= self.max_cycle_length * 2:
-            history: list[str] = list(self._history)
-
+        if len(history) >= self.max_cycle_length * 2:
             for cycle_len in range(
                 2,
                 min(self.max_cycle_length + 1, len(history) // 2 + 1),
             ):
-                recent = history[-cycle_len * 2 :]
-                if recent[:cycle_len] == recent[cycle_len:]:
+                positions: range = range(-cycle_len, 0)
+                if all(hashes[i - cycle_len] == hashes[i] for i in positions) and all(
+                    history[i - cycle_len] == history[i] for i in positions
+                ):
                     return f"Detected repeating cycle of length {cycle_len}"
 
         return None
@@ -138,4 +167,5 @@ class LoopDetector:
         >>> detector.clear()
         """
         self._history.clear()
+        self._hashes.clear()
         logger.debug("Loop detector history cleared")
@@ -14,10 +14,24 @@ from core.context.models import MessageItem
 from core.llm.models import TokenUsage
 from core.prompts.builder import PromptBuilder
 from core.types import MessageDict
-from core.utils.text import Tokenizer
+from core.utils.text import Tokenizer, get_tokenizer
 
 logger = logging.getLogger(__name__)
 
+# Fixed messages that follow the summary in replace_with_summary.
+_SUMMARY_ACK_CONTENT: str = """I've reviewed the context from the previous session. I understand:
+- The original goal and what was requested
+- Which actions are ALREADY COMPLETED (I will NOT repeat these)
+- The current state of the project
+- What still needs to be done
+
+I'll continue with the REMAINING tasks only, starting from where we left off."""
+
+_SUMMARY_CONTINUE_CONTENT: str = (
+    "Continue with the REMAINING work only. Do NOT repeat any completed actions. "
+    "Proceed with the next step as described in the context above."
+)
+
 
 class ContextManager:
     """
@@ -41,10 +55,20 @@ class ContextManager:
         Token threshold before which tool outputs are protected from pruning.
     PRUNE_MINIMUM_TOKENS : int
         Minimum tokens that must be pruned to trigger pruning operation.
+    PRUNED_PLACEHOLDER : str
+        Content that replaces pruned tool outputs.
+    TOKEN_CACHE_MAX_ENTRIES : int
+        Number of cached token counts kept before the cache is reset.
     config : Configuration
         Configuration object.
     _messages : list[MessageItem]
         List of conversation messages.
+    _unpruned_tool_indices : list[int]
+        Positions in ``_messages`` of tool results not yet pruned, oldest
+        first.
+    _api_messages : list[MessageDict]
+        API-format view of the system prompt and ``_messages``, kept in
+        sync incrementally and returned by ``get_messages``.
     _latest_usage : TokenUsage
         Token usage from the most recent request.
     total_usage : TokenUsage
@@ -61,6 +85,8 @@ class ContextManager:
 
     PRUNE_PROTECT_TOKENS: int = 40_000
     PRUNE_MINIMUM_TOKENS: int = 20_000
+    PRUNED_PLACEHOLDER: str = "[Old tool result content cleared]"
+    TOKEN_CACHE_MAX_ENTRIES: int = 10_000
 
     def __init__(
         self,
@@ -74,9 +100,23 @@ class ContextManager:
             user_memory=user_memory,
             tools=tools,
         )
+        # Built once: the system prompt does not change after construction.
+        self._system_message: MessageDict | None = (
+            {"role": "system", "content": self._system_prompt}
+            if self._system_prompt
+            else None
+        )
         self._model_name: str = self.config.model_name
-        self._tokenizer: Tokenizer = Tokenizer(model=self._model_name)
+        self._tokenizer: Tokenizer = get_tokenizer(self._model_name)
+        self._token_cache: dict[str, int] = {}
         self._messages: list[MessageItem] = []
+        self._api_messages: list[MessageDict] = []
+        self._user_message_count: int = 0
+        self._message_tokens: int = 0
+        self._unpruned_tool_indices: list[int] = []
+        self._placeholder_tokens: int | None = None
+        self._summary_reply_tokens: tuple[int, int] | None = None
+        self._reset_api_messages()
         self._latest_usage: TokenUsage = TokenUsage()
         self.total_usage: TokenUsage = TokenUsage()
 
@@ -92,6 +132,109 @@ class ContextManager:
         """
         return len(self._messages)
 
+    @property
+    def message_tokens(self) -> int:
+        """
+        Get the total cached token count of the conversation messages.
+
+        The total is kept up to date as messages are added, pruned, or
+        cleared, so it can be checked between requests without walking the
+        history. It is a local estimate: the system prompt and tool
+        schemas are not included.
+
+        Returns
+        -------
+        int
+            Sum of message token counts.
+
+        Examples
+        --------
+        >>> if manager.message_tokens > budget:
+        ...     manager.prune_tool_outputs()
+        """
+        return self._message_tokens
+
+    def _count_tokens(self, text: str) -> int:
+        """
+        Count tokens in text, reusing counts for content seen before.
+
+        Tool outputs and compaction boilerplate recur often, so counts are
+        cached by the text itself. The cache is reset when it grows past
+        ``TOKEN_CACHE_MAX_ENTRIES``, which bounds the memory it holds on to.
+
+        Parameters
+        ----------
+        text : str
+            Text to count tokens for.
+
+        Returns
+        -------
+        int
+            Number of tokens in the text.
+        """
+        count: int | None = self._token_cache.get(text)
+        if count is None:
+            if len(self._token_cache) >= self.TOKEN_CACHE_MAX_ENTRIES:
+                self._token_cache.clear()
+            count = self._tokenizer.count_tokens(text)
+            self._token_cache[text] = count
+        return count
+
+    def _count_tokens_many(self, texts: list[str]) -> list[int]:
+        """
+        Count tokens for several texts, encoding cache misses in one batch.
+
+        Parameters
+        ----------
+        texts : list[str]
+            Texts to count tokens for.
+
+        Returns
+        -------
+        list[int]
+            Token count for each text, in order.
+        """
+        cache: dict[str, int] = self._token_cache
+        # dict.fromkeys drops repeated texts while keeping their order.
+        misses: list[str] = list(
+            dict.fromkeys(text for text in texts if text not in cache),
+        )
+        if misses:
+            if len(cache) + len(misses) > self.TOKEN_CACHE_MAX_ENTRIES:
+                # Clearing also drops this batch's hits, so count them again.
+                cache.clear()
+                misses = list(dict.fromkeys(texts))
+            cache.update(
+                zip(misses, self._tokenizer.count_tokens_batch(misses), strict=True),
+            )
+        return [cache[text] for text in texts]
+
+    def _reset_api_messages(self) -> None:
+        """
+        Reset the API message view to just the system prompt.
+        """
+        self._user_message_count = 0
+        self._message_tokens = 0
+        self._unpruned_tool_indices.clear()
+        self._api_messages.clear()
+        if self._system_message is not None:
+            self._api_messages.append(self._system_message)
+
+    def _append(self, item: MessageItem) -> None:
+        """
+        Append a message and its API representation in place.
+
+        Parameters
+        ----------
+        item : MessageItem
+            Message to append.
+        """
+        self._messages.append(item)
+        self._api_messages.append(item.to_dict())
+        self._message_tokens += item.token_count or 0
+        if item.role == "user":
+            self._user_message_count += 1
+
     def add_user_message(self, content: str) -> None:
         """
         Add a user message to the context.
@@ -108,14 +251,14 @@ class ContextManager:
         item = MessageItem(
             role="user",
             content=content,
-            token_count=self._tokenizer.count_tokens(content),
+            token_count=self._count_tokens(content),
         )
-        self._messages.append(item)
-        logger.debug(f"Added user message ({item.token_count} tokens)")
+        self._append(item)
+        logger.debug("Added user message (%s tokens)", item.token_count)
 
     def add_assistant_message(
         self,
-        content: str,
+        content: str | None,
         tool_calls: list[dict[str, Any]] | None = None,
     ) -> None:
         """
@@ -123,8 +266,9 @@ class ContextManager:
 
         Parameters
         ----------
-        content : str
-            Content of the assistant message.
+        content : str | None
+            Content of the assistant message, or None if it only made
+            tool calls.
         tool_calls : list[dict[str, Any]] | None, optional
             List of tool calls made by the assistant.
 
@@ -138,13 +282,14 @@ class ContextManager:
         item = MessageItem(
             role="assistant",
             content=content or "",
-            token_count=self._tokenizer.count_tokens(content or ""),
+            token_count=self._count_tokens(content or ""),
             tool_calls=tool_calls or [],
         )
-        self._messages.append(item)
+        self._append(item)
         logger.debug(
-            f"Added assistant message ({item.token_count} tokens, "
-            f"{len(tool_calls or [])} tool calls)",
+            "Added assistant message (%s tokens, %d tool calls)",
+            item.token_count,
+            len(item.tool_calls),
         )
 
     def add_tool_result(self, tool_call_id: str, content: str) -> None:
@@ -166,17 +311,61 @@ class ContextManager:
             role="tool",
             content=content,
             tool_call_id=tool_call_id,
-            token_count=self._tokenizer.count_tokens(content),
+            token_count=self._count_tokens(content),
         )
-        self._messages.append(item)
+        if tool_call_id:
+            self._unpruned_tool_indices.append(len(self._messages))
+        self._append(item)
+        logger.debug(
+            "Added tool result (%s tokens) for %s",
+            item.token_count,
+            tool_call_id,
+        )
+
+    def add_tool_results(self, results: list[tuple[str, str]]) -> None:
+        """
+        Add several tool result messages to the context, in order.
+
+        Equivalent to calling ``add_tool_result`` for each pair, but the
+        token counts are computed in one batch.
+
+        Parameters
+        ----------
+        results : list[tuple[str, str]]
+            ``(tool_call_id, content)`` pairs.
+
+        Examples
+        --------
+        >>> manager.add_tool_results([("call_1", "ok"), ("call_2", "done")])
+        """
+        token_counts: list[int] = self._count_tokens_many(
+            [content for _, content in results],
+        )
+        for (tool_call_id, content), token_count in zip(results, token_counts, strict=True):
+            item = MessageItem(
+                role="tool",
+                content=content,
+                tool_call_id=tool_call_id,
+                token_count=token_count,
+            )
+            if tool_call_id:
+                self._unpruned_tool_indices.append(len(self._messages))
+            self._append(item)
+
         logger.debug(
-            f"Added tool result ({item.token_count} tokens) for {tool_call_id}",
+            "Added %d tool results (%d tokens)",
+            len(results),
+            sum(token_counts),
         )
 
     def get_messages(self) -> list[MessageDict]:
         """
         Get all messages in the format expected by the LLM API.
 
+        The returned list is maintained incrementally and is live: it
+        reflects later additions, so callers must not mutate it and should
+        copy it if they need a stable snapshot.
+
         Returns
         -------
         list[MessageDict]
@@ -187,20 +376,26 @@ class ContextManager:
         >>> messages = manager.get_messages()
         >>> # Returns list with system prompt and all messages
         """
-        messages: list[MessageDict] = []
+        return self._api_messages
 
-        if self._system_prompt:
-            messages.append(
-                {
-                    "role": "system",
-                    "content": self._system_prompt,
-                },
-            )
+    def get_history(self) -> list[MessageItem]:
+        """
+        Get the conversation messages, without the system prompt.
 
-        for item in self._messages:
-            messages.append(item.to_dict())
+        Like ``get_messages``, the returned list is live and must not be
+        mutated.
+
+        Returns
+        -------
+        list[MessageItem]
+            Conversation messages in order.
 
-        return messages
+        Examples
+        --------
+        >>> for item in manager.get_history():
+        ...     print(item.role, item.token_count)
+        """
+        return self._messages
 
     def needs_compression(self) -> bool:
         """
@@ -269,11 +464,12 @@ class ContextManager:
         --------
         >>> manager.replace_with_summary("Previous work: ...")
         """
-        self._messages = []
+        self._messages.clear()
+        self._reset_api_messages()
 
         continuation_content: str = f"""# Context Restoration (Previous Session Compacted)
 
-The previous conversation was compacted due to context length limits. Below is a detailed summary of the work done so far. 
+The previous conversation was compacted due to context length limits. Below is a detailed summary of the work done so far.
 
 **CRITICAL: Actions listed under "COMPLETED ACTIONS" are already done. DO NOT repeat them.**
 
@@ -288,35 +484,31 @@ Resume work from where we left off. Focus ONLY on the remaining tasks."""
         summary_item = MessageItem(
             role="user",
             content=continuation_content,
-            token_count=self._tokenizer.count_tokens(continuation_content),
+            token_count=self._count_tokens(continuation_content),
         )
-        self._messages.append(summary_item)
+        self._append(summary_item)
 
-        ack_content: str = """I've reviewed the context from the previous session. I understand:
-- The original goal and what was requested
-- Which actions are ALREADY COMPLETED (I will NOT repeat these)
-- The current state of the project
-- What still needs to be done
+        # The acknowledgement and follow-up never change; count them once.
+        if self._summary_reply_tokens is None:
+            self._summary_reply_tokens = (
+                self._tokenizer.count_tokens(_SUMMARY_ACK_CONTENT),
+                self._tokenizer.count_tokens(_SUMMARY_CONTINUE_CONTENT),
+            )
+        ack_tokens, continue_tokens = self._summary_reply_tokens
 
-I'll continue with the REMAINING tasks only, starting from where we left off."""
         ack_item = MessageItem(
             role="assistant",
-            content=ack_content,
-            token_count=self._tokenizer.count_tokens(ack_content),
-        )
-        self._messages.append(ack_item)
-
-        continue_content: str = (
-            "Continue with the REMAINING work only. Do NOT repeat any completed actions. "
-            "Proceed with the next step as described in the context above."
+            content=_SUMMARY_ACK_CONTENT,
+            token_count=ack_tokens,
         )
+        self._append(ack_item)
 
         continue_item = MessageItem(
             role="user",
-            content=continue_content,
-            token_count=self._tokenizer.count_tokens(continue_content),
+            content=_SUMMARY_CONTINUE_CONTENT,
+            token_count=continue_tokens,
         )
-        self._messages.append(continue_item)
+        self._append(continue_item)
 
         logger.info("Replaced context with summary for restoration")
 
@@ -325,7 +517,9 @@ I'll continue with the REMAINING tasks only, starting from where we left off."""
         Prune old tool output messages to save tokens.
 
         This method removes content from old tool results while preserving
-        the message structure, helping to stay within token limits.
+        the message structure, helping to stay within token limits. It is
+        called every turn, so it relies on cached token counts and only
+        visits tool results that have not been pruned yet.
 
         Returns
         -------
@@ -337,43 +531,51 @@ I'll continue with the REMAINING tasks only, starting from where we left off."""
         >>> pruned_count = manager.prune_tool_outputs()
         >>> print(f"Pruned {pruned_count} tool outputs")
         """
-        user_message_count: int = sum(
-            (1 for msg in self._messages if msg.role == "user"),
-        )
-
-        if user_message_count < 2:
+        if self._user_message_count < 2:
             return 0
 
+        # Everything older than the protected window is pruned, which is
+        # always a prefix of the candidate list.
+        candidates: list[int] = self._unpruned_tool_indices
         total_tokens: int = 0
         pruned_tokens: int = 0
-        to_prune: list[MessageItem] = []
-
-        for msg in reversed(self._messages):
-            if msg.role == "tool" and msg.tool_call_id:
-                if msg.pruned_at:
-                    break
+        cut: int = 0
 
-                tokens: int = msg.token_count or self._tokenizer.count_tokens(
-                    msg.content,
-                )
-                total_tokens += tokens
+        for position in range(len(candidates) - 1, -1, -1):
+            # Counts are cached on every item when it is added.
+            tokens: int = self._messages[candidates[position]].token_count or 0
+            total_tokens += tokens
 
-                if total_tokens > self.PRUNE_PROTECT_TOKENS:
-                    pruned_tokens += tokens
-                    to_prune.append(msg)
+            if total_tokens > self.PRUNE_PROTECT_TOKENS:
+                pruned_tokens += tokens
+                if not cut:
+                    cut = position + 1
 
         if pruned_tokens < self.PRUNE_MINIMUM_TOKENS:
             return 0
 
+        to_prune: list[int] = candidates[:cut]
+        del candidates[:cut]
+
+        if self._placeholder_tokens is None:
+            self._placeholder_tokens = self._count_tokens(
+                self.PRUNED_PLACEHOLDER,
+            )
+
+        pruned_at: datetime = datetime.now()
+        offset: int = len(self._api_messages) - len(self._messages)
         pruned_count: int = 0
 
-        for msg in to_prune:
-            msg.content = "[Old tool result content cleared]"
-            msg.token_count = self._tokenizer.count_tokens(msg.content)
-            msg.pruned_at = datetime.now()
+        for index in to_prune:
+            msg = self._messages[index]
+            self._message_tokens += self._placeholder_tokens - (msg.token_count or 0)
+            msg.content = self.PRUNED_PLACEHOLDER
+            msg.token_count = self._placeholder_tokens
+            msg.pruned_at = pruned_at
+            self._api_messages[offset + index] = msg.to_dict()
             pruned_count += 1
 
-        logger.info(f"Pruned {pruned_count} tool output messages")
+        logger.info("Pruned %d tool output messages", pruned_count)
         return pruned_count
 
     def clear(self) -> None:
@@ -384,5 +586,6 @@ I'll continue with the REMAINING tasks only, starting from where we left off."""
         --------
         >>> manager.clear()
         """
-        self._messages = []
+        self._messages.clear()
+        self._reset_api_messages()
         logger.debug("Context cleared")
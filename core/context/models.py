@@ -5,16 +5,20 @@ This module defines models for representing messages and context items
 in conversation management.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
 
-
-class MessageItem(BaseModel):
+@dataclass(slots=True)
+class MessageItem:
     """
     Represents a single message in a conversation context.
 
+    This is a slotted dataclass rather than a Pydantic model: one is built
+    for every message added to the context, and compaction and pruning read
+    its attributes for the whole history.
+
     Parameters
     ----------
     role : str
@@ -40,18 +44,12 @@ class MessageItem(BaseModel):
     >>> message_dict = message.to_dict()
     """
 
-    role: str = Field(description="Message role")
-    content: str = Field(default="", description="Message content")
-    tool_call_id: str | None = Field(default=None, description="Tool call ID")
-    tool_calls: list[dict[str, Any]] = Field(
-        default_factory=list,
-        description="Tool calls in this message",
-    )
-    token_count: int | None = Field(default=None, description="Cached token count")
-    pruned_at: datetime | None = Field(
-        default=None,
-        description="Timestamp when message was pruned",
-    )
+    role: str
+    content: str = ""
+    tool_call_id: str | None = None
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    token_count: int | None = None
+    pruned_at: datetime | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """
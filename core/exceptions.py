@@ -6,11 +6,11 @@ codes, context, and serialization capabilities for better error handling
 and debugging.
 """
 
-from typing import Any, Optional
-from enum import Enum
+from enum import StrEnum
+from typing import Any
 
 
-class ErrorCode(str, Enum):
+class ErrorCode(StrEnum):
     """Error codes for categorizing exceptions."""
 
     UNKNOWN = "UNKNOWN"
@@ -23,6 +23,35 @@ class ErrorCode(str, Enum):
     TIMEOUT = "TIMEOUT"
 
 
+def _merge_details(
+    details: dict[str, Any] | None,
+    **extras: Any,
+) -> dict[str, Any]:
+    """
+    Build an error's details dict from caller details and keyword extras.
+
+    Parameters
+    ----------
+    details : dict[str, Any] | None
+        Details supplied by the caller. Copied, never modified.
+    **extras : Any
+        Subclass-specific context; entries whose value is None are skipped.
+
+    Returns
+    -------
+    dict[str, Any]
+        New details dictionary.
+
+    Examples
+    --------
+    >>> _merge_details({"a": 1}, endpoint=None, status_code=500)
+    {'a': 1, 'status_code': 500}
+    """
+    merged: dict[str, Any] = dict(details) if details else {}
+    merged.update({key: value for key, value in extras.items() if value is not None})
+    return merged
+
+
 class DriftError(Exception):
     """
     Base exception class for all Drift framework errors.
@@ -176,11 +205,11 @@ class ConfigurationError(DriftError):
         details: dict[str, Any] | None = None,
         cause: Exception | None = None,
     ) -> None:
-        details = details or {}
-        if config_key:
-            details["config_key"] = config_key
-        if config_file:
-            details["config_file"] = config_file
+        details = _merge_details(
+            details,
+            config_key=config_key or None,
+            config_file=config_file or None,
+        )
         super().__init__(
             message,
             error_code=ErrorCode.CONFIGURATION,
@@ -224,9 +253,7 @@ class ConnectionError(DriftError):
         details: dict[str, Any] | None = None,
         cause: Exception | None = None,
     ) -> None:
-        details = details or {}
-        if endpoint:
-            details["endpoint"] = endpoint
+        details = _merge_details(details, endpoint=endpoint or None)
         super().__init__(
             message,
             error_code=ErrorCode.CONNECTION,
@@ -269,9 +296,7 @@ class APIError(DriftError):
         details: dict[str, Any] | None = None,
         cause: Exception | None = None,
     ) -> None:
-        details = details or {}
-        if status_code is not None:
-            details["status_code"] = status_code
+        details = _merge_details(details, status_code=status_code)
         super().__init__(
             message,
             error_code=ErrorCode.API,
@@ -313,9 +338,7 @@ class RateLimitError(APIError):
         details: dict[str, Any] | None = None,
         cause: Exception | None = None,
     ) -> None:
-        details = details or {}
-        if retry_after is not None:
-            details["retry_after"] = retry_after
+        details = _merge_details(details, retry_after=retry_after)
         super().__init__(
             message,
             status_code=429,
@@ -358,9 +381,7 @@ class ValidationError(DriftError):
         details: dict[str, Any] | None = None,
         cause: Exception | None = None,
     ) -> None:
-        details = details or {}
-        if field:
-            details["field"] = field
+        details = _merge_details(details, field=field or None)
         super().__init__(
             message,
             error_code=ErrorCode.VALIDATION,
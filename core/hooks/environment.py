@@ -5,16 +5,27 @@ This module provides functionality to build environment variables
 for hook execution with context information.
 """
 
-import json
 import os
 from typing import Any
 
+import orjson
+
 from core.config.schema import Configuration, HookTrigger
 from core.tools.models import ToolResult
 
 # Environment variable prefixes
 ENV_PREFIX: str = "AI_AGENT_"
 
+# Full variable names, built once instead of on every hook call.
+_KEY_TRIGGER: str = f"{ENV_PREFIX}TRIGGER"
+_KEY_CWD: str = f"{ENV_PREFIX}CWD"
+_KEY_TOOL_NAME: str = f"{ENV_PREFIX}TOOL_NAME"
+_KEY_TOOL_PARAMS: str = f"{ENV_PREFIX}TOOL_PARAMS"
+_KEY_TOOL_RESULT: str = f"{ENV_PREFIX}TOOL_RESULT"
+_KEY_USER_MESSAGE: str = f"{ENV_PREFIX}USER_MESSAGE"
+_KEY_AGENT_RESPONSE: str = f"{ENV_PREFIX}AGENT_RESPONSE"
+_KEY_ERROR: str = f"{ENV_PREFIX}ERROR"
+
 
 def build_hook_environment(
     config: Configuration,
@@ -29,6 +40,10 @@ def build_hook_environment(
     """
     Build environment variables for hook execution.
 
+    The process environment is copied on every call, so hooks see changes
+    made to ``os.environ`` after startup. The copy costs microseconds,
+    far less than spawning the hook process.
+
     Parameters
     ----------
     config : Configuration
@@ -62,25 +77,25 @@ def build_hook_environment(
     ... )
     """
     env: dict[str, str] = os.environ.copy()
-    env[f"{ENV_PREFIX}TRIGGER"] = trigger.value
-    env[f"{ENV_PREFIX}CWD"] = str(config.cwd)
+    env[_KEY_TRIGGER] = trigger.value
+    env[_KEY_CWD] = str(config.cwd)
 
     if tool_name:
-        env[f"{ENV_PREFIX}TOOL_NAME"] = tool_name
+        env[_KEY_TOOL_NAME] = tool_name
 
     if tool_params:
-        env[f"{ENV_PREFIX}TOOL_PARAMS"] = json.dumps(tool_params)
+        env[_KEY_TOOL_PARAMS] = orjson.dumps(tool_params).decode()
 
     if tool_result:
-        env[f"{ENV_PREFIX}TOOL_RESULT"] = tool_result.to_model_output()
+        env[_KEY_TOOL_RESULT] = tool_result.to_model_output()
 
     if user_message:
-        env[f"{ENV_PREFIX}USER_MESSAGE"] = user_message
+        env[_KEY_USER_MESSAGE] = user_message
 
     if agent_response:
-        env[f"{ENV_PREFIX}AGENT_RESPONSE"] = agent_response
+        env[_KEY_AGENT_RESPONSE] = agent_response
 
     if error:
-        env[f"{ENV_PREFIX}ERROR"] = str(error)
+        env[_KEY_ERROR] = str(error)
 
     return env
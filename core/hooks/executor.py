@@ -8,16 +8,22 @@ timeout handling and error management.
 import asyncio
 import logging
 import os
+import re
+import shlex
+import shutil
 import signal
 import sys
-import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
 
 from core.config.schema import HookConfig
 
 logger = logging.getLogger(__name__)
 
+# Characters whose meaning depends on the shell: pipes, redirection,
+# command lists, substitutions, globs, and comments.
+_SHELL_SYNTAX: re.Pattern[str] = re.compile(r"[|&;<>()$`*?\[\]{}~#!\n]")
+
 
 async def execute_hook(
     hook: HookConfig,
@@ -47,47 +53,124 @@ async def execute_hook(
     """
     try:
         if hook.command:
-            await _run_command(hook.command, hook.timeout_sec, env, cwd)
+            await _run_command(
+                hook.command,
+                hook.timeout_sec,
+                env,
+                cwd,
+                shell=hook.shell,
+            )
         elif hook.script:
-            script_path: Path = await _create_script_file(hook.script)
-            try:
-                await _run_command(str(script_path), hook.timeout_sec, env, cwd)
-            finally:
-                script_path.unlink(missing_ok=True)
+            await _run_script(hook.script, hook.timeout_sec, env, cwd)
     except Exception as e:
         logger.warning(f"Hook '{hook.name}' failed: {e}", exc_info=True)
         # Don't raise - hooks should not break the main flow
 
 
-async def _create_script_file(script_content: str) -> Path:
+async def _run_script(
+    script: str,
+    timeout: float,
+    env: dict[str, str],
+    cwd: Path,
+) -> None:
     """
-    Create a temporary script file from script content.
+    Run inline script content with bash.
+
+    The script is passed to ``bash -c`` as an argument, so no temporary
+    file is written, made executable, and removed for each run.
 
     Parameters
     ----------
-    script_content : str
-        Script content to write.
+    script : str
+        Script content to execute.
+    timeout : float
+        Timeout in seconds.
+    env : dict[str, str]
+        Environment variables.
+    cwd : Path
+        Working directory.
+
+    Raises
+    ------
+    TimeoutError
+        If the script exceeds timeout.
+
+    Examples
+    --------
+    >>> await _run_script("echo 'hello'", 10.0, {}, Path.cwd())
+    """
+    process = await asyncio.create_subprocess_exec(
+        "bash",
+        "-c",
+        script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env=env,
+        start_new_session=True,
+    )
+
+    await _communicate(process, timeout)
+
+
+@lru_cache(maxsize=64)
+def _split_command(
+    command: str,
+    path: str | None,
+    cwd: str,
+) -> tuple[str, ...] | None:
+    """
+    Split a hook command into argv if it can run without a shell.
+
+    A command runs directly only when it has no shell syntax and its
+    program resolves to an executable file. Builtins and reserved words
+    with no binary (``cd``, ``let``, ``if``, ...) do not resolve, so they
+    keep going through the shell. Builtins that also exist as binaries
+    (``echo``, ``test``, ``kill``) resolve to the binary, which is why
+    this is only used for hooks with ``shell`` set to False. Hooks fire
+    repeatedly with the same command, so the split and lookup are cached.
+
+    Parameters
+    ----------
+    command : str
+        Command line from the hook configuration.
+    path : str | None
+        ``PATH`` of the hook environment.
+    cwd : str
+        Working directory the hook runs in, for relative program paths.
 
     Returns
     -------
-    Path
-        Path to the created script file.
+    tuple[str, ...] | None
+        Arguments to execute directly, with the program resolved to its
+        path, or None if the command must go through the shell.
 
     Examples
     --------
-    >>> script_path = await _create_script_file("#!/bin/bash\\necho 'hello'")
+    >>> _split_command("python3 tests.py --quick", "/usr/bin", "/repo")
+    ('/usr/bin/python3', 'tests.py', '--quick')
+    >>> _split_command("make test | tee log.txt", "/usr/bin", "/repo") is None
+    True
     """
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".sh",
-        delete=False,
-    ) as f:
-        f.write("#!/bin/bash\n")
-        f.write(script_content)
-        script_path = Path(f.name)
+    if sys.platform == "win32" or _SHELL_SYNTAX.search(command):
+        return None
+
+    try:
+        argv: list[str] = shlex.split(command)
+    except ValueError:
+        return None
+
+    if not argv:
+        return None
+
+    program: str = argv[0]
+    if os.sep in program:
+        program = os.path.join(cwd, program)
+    executable: str | None = shutil.which(program, path=path)
+    if executable is None:
+        return None
 
-    os.chmod(script_path, 0o755)
-    return script_path
+    return (executable, *argv[1:])
 
 
 async def _run_command(
@@ -95,9 +178,16 @@ async def _run_command(
     timeout: float,
     env: dict[str, str],
     cwd: Path,
+    shell: bool = True,
 ) -> None:
     """
-    Run a shell command with timeout.
+    Run a command with timeout.
+
+    Commands run through the shell unless ``shell`` is False. Then plain
+    commands whose program is found on ``PATH`` are executed directly,
+    saving the ``/bin/sh`` process that would otherwise parse them.
+    Everything else still runs through the shell, as does a direct exec
+    that fails to start.
 
     Parameters
     ----------
@@ -109,28 +199,74 @@ async def _run_command(
         Environment variables.
     cwd : Path
         Working directory.
+    shell : bool, default=True
+        Run the command through the shell.
 
     Raises
     ------
-    asyncio.TimeoutError
+    TimeoutError
         If command exceeds timeout.
 
     Examples
     --------
     >>> await _run_command("echo hello", 10.0, {}, Path.cwd())
     """
-    process = await asyncio.create_subprocess_shell(
-        command,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        cwd=cwd,
-        env=env,
-        start_new_session=True,
+    argv: tuple[str, ...] | None = (
+        None if shell else _split_command(command, env.get("PATH"), str(cwd))
     )
 
+    process: asyncio.subprocess.Process | None = None
+    if argv is not None:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                env=env,
+                start_new_session=True,
+            )
+        except OSError as e:
+            # The cached lookup may be stale (program removed or made
+            # non-executable); let the shell handle and report it.
+            logger.debug(f"Direct exec of {argv[0]} failed, using shell: {e}")
+
+    if process is None:
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            start_new_session=True,
+        )
+
+    await _communicate(process, timeout)
+
+
+async def _communicate(
+    process: asyncio.subprocess.Process,
+    timeout: float,
+) -> None:
+    """
+    Wait for a hook process to finish, killing it on timeout.
+
+    Parameters
+    ----------
+    process : asyncio.subprocess.Process
+        Process started in its own session.
+    timeout : float
+        Timeout in seconds.
+
+    Raises
+    ------
+    TimeoutError
+        If the process exceeds timeout.
+    """
     try:
-        await asyncio.wait_for(process.communicate(), timeout=timeout)
-    except asyncio.TimeoutError:
+        async with asyncio.timeout(timeout):
+            await process.communicate()
+    except TimeoutError:
         if sys.platform != "win32":
             os.killpg(os.getpgid(process.pid), signal.SIGKILL)
         else:
@@ -5,10 +5,11 @@ This module provides the main HookSystem class that manages hook
 execution at different points in the agent lifecycle.
 """
 
+import asyncio
 import logging
 from typing import Any
 
-from core.config.schema import Configuration, HookTrigger
+from core.config.schema import Configuration, HookConfig, HookTrigger
 from core.hooks.environment import build_hook_environment
 from core.hooks.executor import execute_hook
 from core.tools.models import ToolResult
@@ -22,6 +23,7 @@ class HookSystem:
 
     This class manages hook execution at various trigger points including
     before/after agent execution, before/after tool calls, and on errors.
+    Hooks registered for the same trigger run concurrently.
 
     Parameters
     ----------
@@ -34,6 +36,9 @@ class HookSystem:
         Configuration object.
     hooks : list[HookConfig]
         List of enabled hooks.
+    _hooks_by_trigger : dict[HookTrigger, tuple[HookConfig, ...]]
+        Enabled hooks grouped by trigger, in configuration order. Triggers
+        without hooks have no entry.
 
     Examples
     --------
@@ -44,11 +49,45 @@ class HookSystem:
 
     def __init__(self, config: Configuration) -> None:
         self.config: Configuration = config
-        self.hooks: list = []
+        self.hooks: list[HookConfig] = []
+        self._hooks_by_trigger: dict[HookTrigger, tuple[HookConfig, ...]] = {}
         if self.config.hooks_enabled:
             self.hooks = [hook for hook in self.config.hooks if hook.enabled]
+            # Tool triggers fire on every call, so each trigger method looks
+            # up its bucket and returns before building the hook
+            # environment when nothing is listening.
+            for trigger in HookTrigger:
+                matching = tuple(hook for hook in self.hooks if hook.trigger == trigger)
+                if matching:
+                    self._hooks_by_trigger[trigger] = matching
             logger.debug(f"Initialized hook system with {len(self.hooks)} hooks")
 
+    async def _run_hooks(
+        self,
+        hooks: tuple[HookConfig, ...],
+        env: dict[str, str],
+    ) -> None:
+        """
+        Run hooks for one trigger concurrently.
+
+        Each hook is a separate subprocess and ``execute_hook`` never
+        raises, so the trigger takes as long as its slowest hook rather
+        than the sum of all of them.
+
+        Parameters
+        ----------
+        hooks : tuple[HookConfig, ...]
+            Hooks registered for the trigger.
+        env : dict[str, str]
+            Environment shared by all hook processes.
+        """
+        cwd = self.config.cwd
+        if len(hooks) == 1:
+            await execute_hook(hooks[0], env, cwd)
+            return
+
+        await asyncio.gather(*[execute_hook(hook, env, cwd) for hook in hooks])
+
     async def trigger_before_agent(self, user_message: str) -> None:
         """
         Trigger hooks before agent execution.
@@ -62,15 +101,17 @@ class HookSystem:
         --------
         >>> await hook_system.trigger_before_agent("Fix the bug")
         """
+        hooks = self._hooks_by_trigger.get(HookTrigger.BEFORE_AGENT)
+        if not hooks:
+            return
+
         env = build_hook_environment(
             self.config,
             HookTrigger.BEFORE_AGENT,
             user_message=user_message,
         )
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.BEFORE_AGENT:
-                await execute_hook(hook, env, self.config.cwd)
+        await self._run_hooks(hooks, env)
 
     async def trigger_after_agent(
         self,
@@ -91,6 +132,10 @@ class HookSystem:
         --------
         >>> await hook_system.trigger_after_agent("Fix the bug", "Fixed!")
         """
+        hooks = self._hooks_by_trigger.get(HookTrigger.AFTER_AGENT)
+        if not hooks:
+            return
+
         env = build_hook_environment(
             self.config,
             HookTrigger.AFTER_AGENT,
@@ -98,9 +143,7 @@ class HookSystem:
             agent_response=agent_response,
         )
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.AFTER_AGENT:
-                await execute_hook(hook, env, self.config.cwd)
+        await self._run_hooks(hooks, env)
 
     async def trigger_before_tool(
         self,
@@ -121,6 +164,10 @@ class HookSystem:
         --------
         >>> await hook_system.trigger_before_tool("write_file", {"path": "test.py"})
         """
+        hooks = self._hooks_by_trigger.get(HookTrigger.BEFORE_TOOL)
+        if not hooks:
+            return
+
         env = build_hook_environment(
             self.config,
             HookTrigger.BEFORE_TOOL,
@@ -128,9 +175,7 @@ class HookSystem:
             tool_params=tool_params,
         )
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.BEFORE_TOOL:
-                await execute_hook(hook, env, self.config.cwd)
+        await self._run_hooks(hooks, env)
 
     async def trigger_after_tool(
         self,
@@ -154,6 +199,10 @@ class HookSystem:
         --------
         >>> await hook_system.trigger_after_tool("write_file", {}, result)
         """
+        hooks = self._hooks_by_trigger.get(HookTrigger.AFTER_TOOL)
+        if not hooks:
+            return
+
         env = build_hook_environment(
             self.config,
             HookTrigger.AFTER_TOOL,
@@ -162,9 +211,7 @@ class HookSystem:
             tool_result=tool_result,
         )
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.AFTER_TOOL:
-                await execute_hook(hook, env, self.config.cwd)
+        await self._run_hooks(hooks, env)
 
     async def trigger_on_error(self, error: Exception) -> None:
         """
@@ -179,12 +226,14 @@ class HookSystem:
         --------
         >>> await hook_system.trigger_on_error(ValueError("Something went wrong"))
         """
+        hooks = self._hooks_by_trigger.get(HookTrigger.ON_ERROR)
+        if not hooks:
+            return
+
         env = build_hook_environment(
             self.config,
             HookTrigger.ON_ERROR,
             error=error,
         )
 
-        for hook in self.hooks:
-            if hook.trigger == HookTrigger.ON_ERROR:
-                await execute_hook(hook, env, self.config.cwd)
+        await self._run_hooks(hooks, env)
@@ -5,8 +5,9 @@ This module defines protocols (interfaces) that allow for flexible
 implementation and testing through dependency injection.
 """
 
-from typing import Any, AsyncGenerator, Protocol
+from collections.abc import AsyncGenerator
 from pathlib import Path
+from typing import Any, Protocol
 
 from core.llm.models import StreamEvent
 from core.types import MessageDict, ToolDefinitions
@@ -6,14 +6,17 @@ supporting both streaming and non-streaming responses with proper
 error handling and retry logic.
 """
 
-import logging
-from typing import Any, AsyncGenerator
+from __future__ import annotations
 
-from openai import AsyncOpenAI
+import asyncio
+import logging
+import weakref
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Any
 
 from core.config.schema import Configuration
-from core.exceptions import APIError, ConnectionError
-from core.interfaces import LLMClientProtocol
+from core.constants import STREAM_TOOL_ARGS_FLUSH_CHARS
+from core.exceptions import ConnectionError
 from core.llm.models import (
     StreamEvent,
     StreamEventType,
@@ -26,8 +29,49 @@ from core.llm.models import (
 from core.llm.retry import RetryStrategy
 from core.types import MessageDict, ToolDefinitions
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
+# OpenAI clients shared by every LLMClient that talks to the same endpoint
+# from the same event loop (httpx pools are bound to the loop that opened
+# them), each with the number of LLMClients currently holding it. Tables
+# are keyed weakly by loop and purged once their loop is closed, so pools
+# left behind by LLMClients that were never closed do not outlive it.
+_ClientKey = tuple[str, str | None]
+_shared_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    dict[_ClientKey, tuple[AsyncOpenAI, int]],
+] = weakref.WeakKeyDictionary()
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    Get the running event loop, if any.
+
+    Returns
+    -------
+    asyncio.AbstractEventLoop | None
+        The running loop, or None outside of a coroutine.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _purge_closed_loops() -> None:
+    """
+    Drop shared client tables whose event loop has been closed.
+
+    Pooled connections keep a reference to their loop, so a table whose
+    clients were never closed would otherwise keep its dead loop (and the
+    pools) alive despite the weak key.
+    """
+    for loop in [loop for loop in _shared_clients if loop.is_closed()]:
+        del _shared_clients[loop]
+
 
 class LLMClient:
     """
@@ -46,9 +90,19 @@ class LLMClient:
     config : Configuration
         Configuration object.
     _client : AsyncOpenAI | None
-        Internal OpenAI client instance (lazy-initialized).
+        Internal OpenAI client instance (lazy-initialized). Shared with
+        other LLMClients using the same endpoint, so its connection pool
+        is reused by sub-agents and restored sessions.
+    _client_loop : asyncio.AbstractEventLoop | None
+        Loop whose shared client table holds ``_client``, or None if the
+        client was created outside a running loop and is not shared.
+    _client_key : _ClientKey | None
+        API key and base URL ``_client`` is shared under.
     _retry_strategy : RetryStrategy
         Strategy for handling retries.
+    _tools_cache : tuple[ToolDefinitions, list[dict[str, Any]]] | None
+        Last tool definitions passed to ``chat_completion`` and their
+        OpenAI-format build.
 
     Examples
     --------
@@ -64,12 +118,19 @@ class LLMClient:
     def __init__(self, config: Configuration) -> None:
         self.config: Configuration = config
         self._client: AsyncOpenAI | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._client_key: _ClientKey | None = None
         self._retry_strategy: RetryStrategy = RetryStrategy(max_retries=3)
+        self._tools_cache: tuple[ToolDefinitions, list[dict[str, Any]]] | None = None
 
     def _get_client(self) -> AsyncOpenAI:
         """
         Get or create the OpenAI client instance.
 
+        A client already opened for the same API key and base URL on the
+        running event loop is reused rather than creating a new
+        connection pool.
+
         Returns
         -------
         AsyncOpenAI
@@ -81,6 +142,10 @@ class LLMClient:
             If API key is not configured (for OpenAI provider).
         """
         if self._client is None:
+            # Importing openai takes a large share of CLI start-up, so it
+            # is deferred until the first request needs a client.
+            from openai import AsyncOpenAI
+
             api_key: str | None = self.config.api_key
             base_url: str | None = self.config.base_url
 
@@ -96,11 +161,29 @@ class LLMClient:
             if not api_key:
                 api_key = "ollama"  # Placeholder, not actually used
 
-            self._client = AsyncOpenAI(
-                api_key=api_key or "not-required",
-                base_url=base_url,
-            )
-            logger.debug(f"LLM client initialized (provider: {self.config.provider.value})")
+            key: _ClientKey = (api_key, base_url)
+            loop = _running_loop()
+            shared: tuple[AsyncOpenAI, int] | None = None
+            if loop is not None:
+                _purge_closed_loops()
+                clients = _shared_clients.setdefault(loop, {})
+                shared = clients.get(key)
+
+            if shared is None:
+                client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+                # Outside a loop there is no pool to share the client with.
+                if loop is not None:
+                    clients[key] = (client, 1)
+                logger.debug(
+                    f"LLM client initialized (provider: {self.config.provider.value})",
+                )
+            else:
+                client, users = shared
+                clients[key] = (client, users + 1)
+
+            self._client = client
+            self._client_loop = loop
+            self._client_key = key
 
         return self._client
 
@@ -109,7 +192,8 @@ class LLMClient:
         Close the client and release resources.
 
         This method should be called when the client is no longer needed
-        to ensure proper cleanup of connections.
+        to ensure proper cleanup of connections. The shared OpenAI client
+        is closed once its last LLMClient is closed.
 
         Examples
         --------
@@ -118,8 +202,23 @@ class LLMClient:
         >>> await client.close()
         """
         if self._client:
-            await self._client.close()
+            client, loop, key = self._client, self._client_loop, self._client_key
             self._client = None
+            self._client_loop = None
+            self._client_key = None
+
+            clients = _shared_clients.get(loop) if loop is not None else None
+            if loop is not None and clients is not None and key is not None:
+                shared = clients.get(key)
+                if shared is not None and shared[1] > 1:
+                    clients[key] = (client, shared[1] - 1)
+                    return
+
+                clients.pop(key, None)
+                if not clients:
+                    del _shared_clients[loop]
+
+            await client.close()
             logger.debug("LLM client closed")
 
     def _build_tools(self, tools: ToolDefinitions) -> list[dict[str, Any]]:
@@ -156,6 +255,34 @@ class LLMClient:
             for tool in tools
         ]
 
+    def _get_built_tools(self, tools: ToolDefinitions) -> list[dict[str, Any]]:
+        """
+        Get tool definitions in OpenAI format, reusing the last build.
+
+        The agent passes the registry's cached schema list on every turn,
+        and that list is replaced rather than mutated when tools change,
+        so the build is reused for as long as the same list is passed.
+        The cache holds a reference to the list, so its identity cannot be
+        reused by another object.
+
+        Parameters
+        ----------
+        tools : ToolDefinitions
+            List of tool definitions.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Tool definitions in OpenAI format. Shared; must not be mutated.
+        """
+        cached = self._tools_cache
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+
+        built: list[dict[str, Any]] = self._build_tools(tools)
+        self._tools_cache = (tools, built)
+        return built
+
     async def chat_completion(
         self,
         messages: list[MessageDict],
@@ -196,15 +323,18 @@ class LLMClient:
         """
         client: AsyncOpenAI = self._get_client()
 
+        # Read per call: /model can switch the model mid-session. A literal
+        # builds the request in one step, unlike copying a template.
+        model_config = self.config.model
         kwargs: dict[str, Any] = {
-            "model": self.config.model_name,
+            "model": model_config.name,
             "messages": messages,
             "stream": stream,
-            "temperature": self.config.temperature,
+            "temperature": model_config.temperature,
         }
 
         if tools:
-            kwargs["tools"] = self._build_tools(tools)
+            kwargs["tools"] = self._get_built_tools(tools)
             kwargs["tool_choice"] = "auto"
 
         try:
@@ -212,10 +342,11 @@ class LLMClient:
                 async for event in self._stream_response(client, kwargs):
                     yield event
             else:
-                event: StreamEvent = await self._retry_strategy.execute(
+                events: list[StreamEvent] = await self._retry_strategy.execute(
                     lambda: self._non_stream_response(client, kwargs),
                 )
-                yield event
+                for event in events:
+                    yield event
         except Exception as e:
             logger.error(f"Error in chat completion: {e}", exc_info=True)
             yield StreamEvent(
@@ -251,78 +382,117 @@ class LLMClient:
         usage: TokenUsage | None = None
         tool_calls: dict[int, dict[str, Any]] = {}
 
+        # Argument fragments arrive a few characters at a time; they are
+        # coalesced per tool call and emitted as one TOOL_CALL_DELTA per
+        # STREAM_TOOL_ARGS_FLUSH_CHARS, or before any other event so the
+        # stream order is preserved.
+        pending_idx: int = -1
+        pending_args: list[str] = []
+        pending_chars: int = 0
+
+        def flush_args() -> StreamEvent:
+            nonlocal pending_chars
+            tc = tool_calls[pending_idx]
+            event = StreamEvent(
+                type=StreamEventType.TOOL_CALL_DELTA,
+                tool_call_delta=ToolCallDelta(
+                    call_id=tc["id"],
+                    name=tc["name"],
+                    arguments_delta="".join(pending_args),
+                ),
+            )
+            pending_args.clear()
+            pending_chars = 0
+            return event
+
+        # Text deltas arrive once per token; bind what building one needs.
+        text_delta_type = StreamEventType.TEXT_DELTA
+        stream_event = StreamEvent
+        text_delta = TextDelta
+
         async for chunk in response:
-            if hasattr(chunk, "usage") and chunk.usage:
+            chunk_usage = getattr(chunk, "usage", None)
+            if chunk_usage:
+                details = getattr(chunk_usage, "prompt_tokens_details", None)
                 usage = TokenUsage(
-                    prompt_tokens=chunk.usage.prompt_tokens or 0,
-                    completion_tokens=chunk.usage.completion_tokens or 0,
-                    total_tokens=chunk.usage.total_tokens or 0,
-                    cached_tokens=(
-                        chunk.usage.prompt_tokens_details.cached_tokens
-                        if hasattr(chunk.usage, "prompt_tokens_details")
-                        and chunk.usage.prompt_tokens_details
-                        else 0
-                    ),
+                    prompt_tokens=chunk_usage.prompt_tokens or 0,
+                    completion_tokens=chunk_usage.completion_tokens or 0,
+                    total_tokens=chunk_usage.total_tokens or 0,
+                    cached_tokens=details.cached_tokens if details else 0,
                 )
 
-            if not chunk.choices:
+            choices = chunk.choices
+            if not choices:
                 continue
 
-            choice = chunk.choices[0]
+            choice = choices[0]
             delta = choice.delta
 
             if choice.finish_reason:
                 finish_reason = choice.finish_reason
 
-            if delta.content:
-                yield StreamEvent(
-                    type=StreamEventType.TEXT_DELTA,
-                    text_delta=TextDelta(content=delta.content),
+            content = delta.content
+            if content:
+                if pending_args:
+                    yield flush_args()
+                yield stream_event(
+                    type=text_delta_type,
+                    text_delta=text_delta(content=content),
                 )
 
-            if delta.tool_calls:
-                for tool_call_delta in delta.tool_calls:
-                    idx: int = tool_call_delta.index
-
-                    if idx not in tool_calls:
-                        tool_calls[idx] = {
-                            "id": tool_call_delta.id or "",
-                            "name": "",
-                            "arguments": "",
-                        }
-
-                        if tool_call_delta.function and tool_call_delta.function.name:
-                            tool_calls[idx]["name"] = tool_call_delta.function.name
-                            yield StreamEvent(
-                                type=StreamEventType.TOOL_CALL_START,
-                                tool_call_delta=ToolCallDelta(
-                                    call_id=tool_calls[idx]["id"],
-                                    name=tool_call_delta.function.name,
-                                ),
-                            )
-
-                    if tool_call_delta.function and tool_call_delta.function.arguments:
-                        tool_calls[idx]["arguments"] += tool_call_delta.function.arguments
+            delta_tool_calls = delta.tool_calls
+            if not delta_tool_calls:
+                continue
+
+            for tool_call_delta in delta_tool_calls:
+                idx: int = tool_call_delta.index
+                function = tool_call_delta.function
+
+                if pending_args and idx != pending_idx:
+                    yield flush_args()
 
+                tc = tool_calls.get(idx)
+                if tc is None:
+                    tc = tool_calls[idx] = {
+                        "id": tool_call_delta.id or "",
+                        "name": "",
+                        # Fragments are joined once, when the call completes.
+                        "arg_parts": [],
+                    }
+
+                    if function and function.name:
+                        tc["name"] = function.name
                         yield StreamEvent(
-                            type=StreamEventType.TOOL_CALL_DELTA,
+                            type=StreamEventType.TOOL_CALL_START,
                             tool_call_delta=ToolCallDelta(
-                                call_id=tool_calls[idx]["id"],
-                                name=tool_calls[idx]["name"],
-                                arguments_delta=tool_call_delta.function.arguments,
+                                call_id=tc["id"],
+                                name=function.name,
                             ),
                         )
 
+                arguments = function.arguments if function else None
+                if arguments:
+                    tc["arg_parts"].append(arguments)
+                    pending_idx = idx
+                    pending_args.append(arguments)
+                    pending_chars += len(arguments)
+                    if pending_chars >= STREAM_TOOL_ARGS_FLUSH_CHARS:
+                        yield flush_args()
+
+        if pending_args:
+            yield flush_args()
+
         # Emit complete tool calls
-        for idx, tc in tool_calls.items():
-            yield StreamEvent(
-                type=StreamEventType.TOOL_CALL_COMPLETE,
-                tool_call=ToolCall(
-                    call_id=tc["id"],
-                    name=tc["name"],
-                    arguments=parse_tool_call_arguments(tc["arguments"]),
-                ),
-            )
+        if tool_calls:
+            for tc in tool_calls.values():
+                yield StreamEvent(
+                    type=StreamEventType.TOOL_CALL_COMPLETE,
+                    tool_call=ToolCall(
+                        call_id=tc["id"],
+                        name=tc["name"],
+                        arguments=parse_tool_call_arguments("".join(tc["arg_parts"])),
+                    ),
+                )
 
         # Emit completion event
         yield StreamEvent(
@@ -335,10 +505,13 @@ class LLMClient:
         self,
         client: AsyncOpenAI,
         kwargs: dict[str, Any],
-    ) -> StreamEvent:
+    ) -> list[StreamEvent]:
         """
         Handle non-streaming response from the API.
 
+        Tool calls are reported the same way as when streaming: one
+        TOOL_CALL_COMPLETE event per call, before the completion event.
+
         Parameters
         ----------
         client : AsyncOpenAI
@@ -348,8 +521,9 @@ class LLMClient:
 
         Returns
         -------
-        StreamEvent
-            A single completion event with the full response.
+        list[StreamEvent]
+            Tool call events, if any, followed by a completion event with
+            the full text and usage.
         """
         response = await client.chat.completions.create(**kwargs)
         choice = response.choices[0]
@@ -359,39 +533,37 @@ class LLMClient:
         if message.content:
             text_delta = TextDelta(content=message.content)
 
-        tool_calls: list[ToolCall] = []
+        events: list[StreamEvent] = []
         if message.tool_calls:
             for tc in message.tool_calls:
-                tool_calls.append(
-                    ToolCall(
-                        call_id=tc.id,
-                        name=tc.function.name,
-                        arguments=parse_tool_call_arguments(tc.function.arguments),
+                events.append(
+                    StreamEvent(
+                        type=StreamEventType.TOOL_CALL_COMPLETE,
+                        tool_call=ToolCall(
+                            call_id=tc.id,
+                            name=tc.function.name,
+                            arguments=parse_tool_call_arguments(tc.function.arguments),
+                        ),
                     ),
                 )
 
         usage: TokenUsage | None = None
-        if response.usage:
+        response_usage = response.usage
+        if response_usage:
+            details = getattr(response_usage, "prompt_tokens_details", None)
             usage = TokenUsage(
-                prompt_tokens=response.usage.prompt_tokens or 0,
-                completion_tokens=response.usage.completion_tokens or 0,
-                total_tokens=response.usage.total_tokens or 0,
-                cached_tokens=(
-                    response.usage.prompt_tokens_details.cached_tokens
-                    if hasattr(response.usage, "prompt_tokens_details")
-                    and response.usage.prompt_tokens_details
-                    else 0
-                ),
+                prompt_tokens=response_usage.prompt_tokens or 0,
+                completion_tokens=response_usage.completion_tokens or 0,
+                total_tokens=response_usage.total_tokens or 0,
+                cached_tokens=details.cached_tokens if details else 0,
             )
 
-        return StreamEvent(
-            type=StreamEventType.MESSAGE_COMPLETE,
-            text_delta=text_delta,
-            finish_reason=choice.finish_reason,
-            usage=usage,
-            tool_call=ToolCall(
-                call_id="",
-                name=None,
-                arguments={},
-            ) if tool_calls else None,
+        events.append(
+            StreamEvent(
+                type=StreamEventType.MESSAGE_COMPLETE,
+                text_delta=text_delta,
+                finish_reason=choice.finish_reason,
+                usage=usage,
+            ),
         )
+        return events
@@ -9,13 +9,14 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import BaseModel, Field
 
 
-class StreamEventType(str, Enum):
+class StreamEventType(StrEnum):
     """Types of events in a streaming response."""
 
     TEXT_DELTA = "text_delta"
@@ -109,13 +110,50 @@ class TokenUsage(BaseModel):
         >>> print(total.total_tokens)
         450
         """
-        return TokenUsage(
+        # Sums of validated non-negative counts need no re-validation.
+        return TokenUsage.model_construct(
             prompt_tokens=self.prompt_tokens + other.prompt_tokens,
             completion_tokens=self.completion_tokens + other.completion_tokens,
             total_tokens=self.total_tokens + other.total_tokens,
             cached_tokens=self.cached_tokens + other.cached_tokens,
         )
 
+    def to_dict(self) -> dict[str, int]:
+        """
+        Convert usage to a plain dictionary without going through ``model_dump``.
+
+        Returns
+        -------
+        dict[str, int]
+            Token counts keyed by field name.
+        """
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cached_tokens": self.cached_tokens,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TokenUsage:
+        """
+        Create usage from a dictionary previously produced by ``to_dict``.
+
+        Validation is skipped, so this is only for trusted data such as
+        saved sessions.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Token counts keyed by field name.
+
+        Returns
+        -------
+        TokenUsage
+            Usage instance.
+        """
+        return cls.model_construct(**data)
+
 
 class ToolCallDelta(BaseModel):
     """
@@ -144,10 +182,14 @@ class ToolCallDelta(BaseModel):
     arguments_delta: str = Field(default="", description="Incremental arguments")
 
 
-class ToolCall(BaseModel):
+@dataclass(slots=True)
+class ToolCall:
     """
     Represents a complete tool call.
 
+    This is a slotted dataclass rather than a Pydantic model because the
+    agent loop reads its attributes for every call it dispatches.
+
     Parameters
     ----------
     call_id : str
@@ -155,7 +197,8 @@ class ToolCall(BaseModel):
     name : str | None, optional
         Name of the tool being called.
     arguments : dict[str, Any] | str, default=""
-        Arguments for the tool call. Can be a dictionary or JSON string.
+        Arguments for the tool call. JSON strings are parsed into a
+        dictionary when valid.
 
     Examples
     --------
@@ -166,37 +209,56 @@ class ToolCall(BaseModel):
     ... )
     """
 
-    call_id: str = Field(description="Tool call identifier")
-    name: str | None = Field(default=None, description="Tool name")
-    arguments: dict[str, Any] | str = Field(
-        default="",
-        description="Tool call arguments",
-    )
+    call_id: str
+    name: str | None = None
+    arguments: dict[str, Any] | str = ""
 
-    @field_validator("arguments", mode="before")
-    @classmethod
-    def parse_arguments(cls, v: Any) -> dict[str, Any] | str:
+    def __post_init__(self) -> None:
         """
         Parse arguments if they are a JSON string.
+        """
+        if isinstance(self.arguments, str) and self.arguments:
+            try:
+                self.arguments = json.loads(self.arguments)
+            except json.JSONDecodeError:
+                pass
 
-        Parameters
-        ----------
-        v : Any
-            Arguments value (dict, str, or other).
+    def arguments_json(self) -> str:
+        """
+        Serialize the arguments as a JSON string for the LLM API.
 
         Returns
         -------
-        dict[str, Any] | str
-            Parsed arguments as dict if valid JSON, otherwise original value.
+        str
+            Arguments encoded as JSON, or the raw string if unparsed.
+
+        Examples
+        --------
+        >>> ToolCall(call_id="1", arguments={"path": "a.py"}).arguments_json()
+        '{"path":"a.py"}'
         """
-        if isinstance(v, dict):
-            return v
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return v
-        return v
+        if isinstance(self.arguments, str):
+            return self.arguments
+        return orjson.dumps(self.arguments).decode()
+
+    def arguments_dict(self) -> dict[str, Any]:
+        """
+        Get the arguments as a dictionary for tool invocation.
+
+        Returns
+        -------
+        dict[str, Any]
+            Parsed arguments, or an empty dict if they were empty or not
+            valid JSON, so tool validation reports the missing parameters.
+
+        Examples
+        --------
+        >>> ToolCall(call_id="1", arguments="not json").arguments_dict()
+        {}
+        """
+        if isinstance(self.arguments, str):
+            return {}
+        return self.arguments
 
 
 class StreamEvent(BaseModel):
@@ -240,10 +302,14 @@ class StreamEvent(BaseModel):
     usage: TokenUsage | None = Field(default=None, description="Token usage")
 
 
-class ToolResultMessage(BaseModel):
+@dataclass(slots=True)
+class ToolResultMessage:
     """
     Represents a result message from a tool execution.
 
+    Like ``ToolCall``, this is a slotted dataclass so building one per
+    tool result does not pay for validation.
+
     Parameters
     ----------
     tool_call_id : str
@@ -262,9 +328,9 @@ class ToolResultMessage(BaseModel):
     ... )
     """
 
-    tool_call_id: str = Field(description="Tool call identifier")
-    content: str = Field(description="Result content")
-    is_error: bool = Field(default=False, description="Whether this is an error")
+    tool_call_id: str
+    content: str
+    is_error: bool = False
 
     def to_openai_message(self) -> dict[str, Any]:
         """
@@ -320,6 +386,7 @@ def parse_tool_call_arguments(arguments_str: str) -> dict[str, Any]:
         return {}
 
     try:
-        return json.loads(arguments_str)
+        parsed: dict[str, Any] = json.loads(arguments_str)
+        return parsed
     except json.JSONDecodeError:
         return {"raw_arguments": arguments_str}
@@ -7,9 +7,8 @@ transient failures in LLM API requests.
 
 import asyncio
 import logging
-from typing import Any, Callable, TypeVar
-
-from openai import APIConnectionError, APIError, RateLimitError as OpenAIRateLimitError
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from core.constants import DEFAULT_RETRY_BASE_DELAY, DEFAULT_RETRY_MAX_DELAY
 from core.exceptions import ConnectionError, RateLimitError
@@ -91,6 +90,16 @@ class RetryStrategy:
         Exception
             The last exception if all retries are exhausted, or a non-retryable error.
         """
+        # Deferred like the client itself; by the time a request is retried
+        # the client has already imported openai.
+        from openai import (
+            APIConnectionError,
+            APIError,
+        )
+        from openai import (
+            RateLimitError as OpenAIRateLimitError,
+        )
+
         last_exception: Exception | None = None
 
         for attempt in range(self.max_retries + 1):
@@ -10,6 +10,7 @@ import os
 import platform
 import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from core.config.schema import Configuration
@@ -500,10 +501,14 @@ IMPORTANT: Structure your response EXACTLY as follows:
 Be extremely specific with file paths and function names. The goal is to allow seamless continuation without redoing any completed work."""
 
 
+@lru_cache(maxsize=32)
 def create_loop_breaker_prompt(loop_description: str) -> str:
     """
     Create a prompt to break out of repetitive loops.
 
+    Results are cached, since a stuck agent tends to hit the same loop
+    description on consecutive turns.
+
     Parameters
     ----------
     loop_description : str
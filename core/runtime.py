@@ -0,0 +1,90 @@
+"""
+Event loop runtime configuration for the Drift framework.
+
+This module selects the asyncio event loop implementation used by the
+agent. When the optional ``uvloop`` package is installed (non-Windows
+platforms only), ``run`` executes the CLI on a uvloop event loop, which
+speeds up the streaming, tool fan-out, and hook I/O in the agent loop.
+The global event loop policy is never changed, so importing ``core``
+leaves other asyncio users alone.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# A TypeVar rather than PEP 695 syntax, so this module still imports on
+# Python 3.11 interpreters.
+T = TypeVar("T")
+
+# Set to "0" to keep the stdlib event loop even when uvloop is installed.
+UVLOOP_ENV_VAR: str = "DRIFT_UVLOOP"
+
+
+def uvloop_enabled() -> bool:
+    """
+    Check whether uvloop may be used on this platform and configuration.
+
+    Returns
+    -------
+    bool
+        True if uvloop is installed, supported, and not disabled via the
+        ``DRIFT_UVLOOP`` environment variable.
+
+    Examples
+    --------
+    >>> if uvloop_enabled():
+    ...     print("Using uvloop")
+    """
+    if sys.platform == "win32":
+        return False
+
+    if os.environ.get(UVLOOP_ENV_VAR, "1").strip().lower() in {"0", "false", "no", "off"}:
+        return False
+
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return False
+
+    return True
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:  # noqa: UP047
+    """
+    Run a coroutine to completion on a new event loop.
+
+    This replaces ``asyncio.run`` for the CLI entry points. The loop is a
+    uvloop loop when ``uvloop_enabled()`` is True, passed to
+    ``asyncio.Runner`` as its loop factory, and the stdlib loop otherwise.
+    The environment is checked on each call, so ``DRIFT_UVLOOP`` set in a
+    ``.env`` file loaded beforehand is honoured.
+
+    Parameters
+    ----------
+    main : Coroutine[Any, Any, T]
+        Coroutine to run.
+
+    Returns
+    -------
+    T
+        Result of the coroutine.
+
+    Examples
+    --------
+    >>> result = run(cli.run_single("Hello"))
+    """
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None
+    if uvloop_enabled():
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+        logger.debug("Running on a uvloop event loop")
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
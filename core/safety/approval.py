@@ -6,8 +6,8 @@ for tool calls based on configuration policies and command patterns.
 """
 
 import logging
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import Any, Awaitable, Callable
 
 from core.config.schema import ApprovalPolicy, Configuration
 from core.safety.models import ApprovalContext, ApprovalDecision, ToolConfirmation
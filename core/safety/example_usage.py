@@ -31,7 +31,7 @@ def example_confirmation_callback(confirmation: ToolConfirmation) -> bool:
     bool
         True if user approves, False otherwise.
     """
-    print(f"\n⚠️  Approval Request")
+    print("\n⚠️  Approval Request")
     print(f"Tool: {confirmation.tool_name}")
     print(f"Description: {confirmation.description}")
     print(f"Affected paths: {confirmation.context.affected_paths}")
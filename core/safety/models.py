@@ -4,14 +4,14 @@ Data models for safety and approval management.
 This module defines models for representing approval contexts and decisions.
 """
 
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
-class ApprovalDecision(str, Enum):
+class ApprovalDecision(StrEnum):
     """
     Decision types for tool call approvals.
 
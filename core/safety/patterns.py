@@ -6,7 +6,7 @@ commands to help make approval decisions.
 """
 
 import re
-from typing import Pattern
+from re import Pattern
 
 # Dangerous command patterns that should be rejected or require confirmation
 DANGEROUS_PATTERNS: list[Pattern[str]] = [
@@ -13,9 +13,9 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from core.config.loader import load_configuration
-from core.tools.registry import ToolRegistry
-from core.tools.builtin import get_all_builtin_tools
 from core.hooks.system import HookSystem
+from core.tools.builtin import get_all_builtin_tools
+from core.tools.registry import ToolRegistry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
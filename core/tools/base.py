@@ -6,13 +6,13 @@ with parameter validation, schema generation, and safety checking.
 """
 
 import abc
+from functools import cache
 from typing import Any
 
 from pydantic import BaseModel, ValidationError
 from pydantic.json_schema import model_json_schema
 
 from core.config.schema import Configuration
-from core.tools.interfaces import ToolProtocol
 from core.tools.models import (
     ToolConfirmation,
     ToolInvocation,
@@ -24,6 +24,34 @@ from core.tools.models import (
 __all__ = ["Tool", "ToolKind"]
 
 
+@cache
+def _model_parameters(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Build the OpenAI parameters object for a Pydantic parameter model.
+
+    JSON schema generation is the expensive part of registering a tool,
+    and parameter models are shared by every instance of a tool class, so
+    the result is computed once per model and reused across sessions. The
+    returned dictionary is shared and must not be mutated.
+
+    Parameters
+    ----------
+    model : type[BaseModel]
+        Pydantic model describing the tool parameters.
+
+    Returns
+    -------
+    dict[str, Any]
+        Parameters object with ``type``, ``properties`` and ``required``.
+    """
+    json_schema = model_json_schema(model, mode="serialization")
+    return {
+        "type": "object",
+        "properties": json_schema.get("properties", {}),
+        "required": json_schema.get("required", []),
+    }
+
+
 class Tool(abc.ABC):
     """
     Abstract base class for all tools.
@@ -45,6 +73,10 @@ class Tool(abc.ABC):
         Human-readable description (must be set by subclasses).
     kind : ToolKind
         Category of tool operation (must be set by subclasses).
+    parallel_safe : bool
+        Whether calls may run concurrently with other parallel-safe calls.
+        Defaults to True for READ tools; subclasses may override it with a
+        class attribute.
     config : Configuration
         Configuration object.
 
@@ -145,6 +177,18 @@ class Tool(abc.ABC):
 
         return []
 
+    @property
+    def parallel_safe(self) -> bool:
+        """
+        Whether this tool can run concurrently with other parallel-safe tools.
+
+        Returns
+        -------
+        bool
+            True for read-only tools, False otherwise.
+        """
+        return self.kind == ToolKind.READ
+
     def is_mutating(self, params: dict[str, Any]) -> bool:
         """
         Check if the tool operation modifies system state.
@@ -225,16 +269,10 @@ class Tool(abc.ABC):
         schema = self.schema
 
         if isinstance(schema, type) and issubclass(schema, BaseModel):
-            json_schema = model_json_schema(schema, mode="serialization")
-
             return {
                 "name": self.name,
                 "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": json_schema.get("properties", {}),
-                    "required": json_schema.get("required", []),
-                },
+                "parameters": _model_parameters(schema),
             }
 
         if isinstance(schema, dict):
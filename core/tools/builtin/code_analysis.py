@@ -13,6 +13,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolInvocation, ToolKind, ToolResult
 from core.tools.registration.decorator import register_tool
@@ -358,7 +359,7 @@ class FindImportsTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[FindImportsParams] = FindImportsParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
@@ -432,7 +433,7 @@ class FindDefinitionsTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[FindDefinitionsParams] = FindDefinitionsParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
@@ -511,7 +512,7 @@ class FindUsagesTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[FindUsagesParams] = FindUsagesParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
@@ -580,7 +581,7 @@ class CodeMetricsTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[CodeMetricsParams] = CodeMetricsParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
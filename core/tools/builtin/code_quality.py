@@ -12,6 +12,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolInvocation, ToolKind, ToolResult
 from core.tools.registration.decorator import register_tool
@@ -148,7 +149,7 @@ class FormatCodeTool(Tool):
     kind: ToolKind = ToolKind.WRITE
     schema: type[FormatCodeParams] = FormatCodeParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     def is_mutating(self, params: dict[str, Any]) -> bool:
@@ -269,7 +270,7 @@ class LintCodeTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[LintCodeParams] = LintCodeParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
@@ -398,7 +399,7 @@ class TypeCheckTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[TypeCheckParams] = TypeCheckParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
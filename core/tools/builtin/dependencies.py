@@ -12,6 +12,7 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolInvocation, ToolKind, ToolResult
 from core.tools.registration.decorator import register_tool
@@ -107,9 +108,9 @@ def _parse_python_dependencies(cwd: Path) -> dict[str, str] | None:
     pyproject = cwd / "pyproject.toml"
     if pyproject.exists():
         try:
-            import tomli
+            import tomllib
 
-            data = tomli.loads(pyproject.read_text())
+            data = tomllib.loads(pyproject.read_text())
             deps = {}
             if "project" in data and "dependencies" in data["project"]:
                 for dep in data["project"]["dependencies"]:
@@ -181,7 +182,7 @@ class ListDependenciesTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[ListDependenciesParams] = ListDependenciesParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
@@ -253,7 +254,7 @@ class CheckUpdatesTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[CheckUpdatesParams] = CheckUpdatesParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
@@ -12,6 +12,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolConfirmation, ToolInvocation, ToolKind, ToolResult
 from core.tools.registration.decorator import register_tool
@@ -140,7 +141,7 @@ class CopyFileTool(Tool):
     kind: ToolKind = ToolKind.WRITE
     schema: type[CopyFileParams] = CopyFileParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     def is_mutating(self, params: dict[str, Any]) -> bool:
@@ -153,7 +154,6 @@ class CopyFileTool(Tool):
     ) -> ToolConfirmation | None:
         """Get confirmation request for copy operations."""
         params = CopyFileParams(**invocation.params)
-        source_path: Path = resolve_path(invocation.cwd, params.source)
         dest_path: Path = resolve_path(invocation.cwd, params.destination)
 
         # Check if destination exists
@@ -246,7 +246,7 @@ class MoveFileTool(Tool):
     kind: ToolKind = ToolKind.WRITE
     schema: type[MoveFileParams] = MoveFileParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     def is_mutating(self, params: dict[str, Any]) -> bool:
@@ -339,7 +339,7 @@ class DeleteFileTool(Tool):
     kind: ToolKind = ToolKind.WRITE
     schema: type[DeleteFileParams] = DeleteFileParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     def is_mutating(self, params: dict[str, Any]) -> bool:
@@ -439,7 +439,7 @@ class CreateDirectoryTool(Tool):
     kind: ToolKind = ToolKind.WRITE
     schema: type[CreateDirectoryParams] = CreateDirectoryParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     def is_mutating(self, params: dict[str, Any]) -> bool:
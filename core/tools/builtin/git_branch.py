@@ -12,6 +12,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolConfirmation, ToolInvocation, ToolKind, ToolResult
 from core.utils.paths import resolve_path
@@ -85,7 +86,7 @@ class GitBranchTool(Tool):
     kind: ToolKind = ToolKind.WRITE
     schema: type[GitBranchParams] = GitBranchParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     def is_mutating(self, params: dict[str, Any]) -> bool:
@@ -286,7 +287,7 @@ class GitBranchTool(Tool):
                         "Branch name is required for switch action",
                     )
 
-                cmd: list[str] = ["git", "checkout"]
+                cmd = ["git", "checkout"]
                 if params.force:
                     cmd.append("-f")
                 cmd.append(params.branch_name)
@@ -12,6 +12,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolConfirmation, ToolInvocation, ToolKind, ToolResult
 from core.utils.paths import resolve_path
@@ -106,7 +107,7 @@ class GitCommitTool(Tool):
     kind: ToolKind = ToolKind.WRITE
     schema: type[GitCommitParams] = GitCommitParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     def is_mutating(self, params: dict[str, Any]) -> bool:
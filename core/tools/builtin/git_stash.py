@@ -12,6 +12,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolConfirmation, ToolInvocation, ToolKind, ToolResult
 from core.utils.paths import resolve_path
@@ -85,7 +86,7 @@ class GitStashTool(Tool):
     kind: ToolKind = ToolKind.WRITE
     schema: type[GitStashParams] = GitStashParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     def is_mutating(self, params: dict[str, Any]) -> bool:
@@ -232,7 +233,7 @@ class GitStashTool(Tool):
                         output=result.stdout,
                     )
 
-                output: str = result.stdout
+                output = result.stdout
                 if not output:
                     output = "Changes stashed successfully"
                 if params.message:
@@ -270,7 +271,7 @@ class GitStashTool(Tool):
                 )
 
             elif action == "pop":
-                stash_ref: str = (
+                stash_ref = (
                     f"stash@{{{params.stash_index}}}"
                     if params.stash_index is not None
                     else "stash@{0}"
@@ -296,7 +297,7 @@ class GitStashTool(Tool):
                 )
 
             elif action == "drop":
-                stash_ref: str = (
+                stash_ref = (
                     f"stash@{{{params.stash_index}}}"
                     if params.stash_index is not None
                     else "stash@{0}"
@@ -11,6 +11,7 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolInvocation, ToolKind, ToolResult
 from core.utils.paths import resolve_path
@@ -71,7 +72,7 @@ class GitStatusTool(Tool):
     kind: ToolKind = ToolKind.READ
     schema: type[GitStatusParams] = GitStatusParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
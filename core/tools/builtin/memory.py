@@ -84,16 +84,15 @@ class MemoryTool(Tool):
         dict[str, Any]
             Memory dictionary with entries.
         """
-        data_dir: Path = get_data_dir()
-        data_dir.mkdir(parents=True, exist_ok=True)
-        path: Path = data_dir / "user_memory.json"
+        path: Path = get_data_dir() / "user_memory.json"
 
         if not path.exists():
             return {"entries": {}}
 
         try:
             content: str = path.read_text(encoding="utf-8")
-            return json.loads(content)
+            memory: dict[str, Any] = json.loads(content)
+            return memory
         except Exception as e:
             logger.warning(f"Failed to load memory from {path}: {e}")
             return {"entries": {}}
@@ -10,10 +10,11 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolInvocation, ToolKind, ToolResult
 from core.utils.paths import is_binary_file, resolve_path
-from core.utils.text import Tokenizer
+from core.utils.text import Tokenizer, get_tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -88,9 +89,9 @@ class ReadFileTool(Tool):
     MAX_FILE_SIZE: int = 1024 * 1024 * 10  # 10MB
     MAX_OUTPUT_TOKENS: int = 25000
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
-        self._tokenizer: Tokenizer = Tokenizer(model=self.config.model_name)
+        self._tokenizer: Tokenizer = get_tokenizer(self.config.model_name)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
         """
@@ -161,7 +162,7 @@ class ReadFileTool(Tool):
             if params.limit is not None:
                 end_idx: int = min(start_idx + params.limit, total_lines)
             else:
-                end_idx: int = total_lines
+                end_idx = total_lines
 
             selected_lines: list[str] = lines[start_idx:end_idx]
             formatted_lines: list[str] = []
@@ -6,7 +6,6 @@ support, environment variable filtering, and safety checks.
 """
 
 import asyncio
-import fnmatch
 import logging
 import os
 import signal
@@ -196,7 +195,7 @@ class ShellTool(Tool):
                 process.communicate(),
                 timeout=params.timeout,
             )
-        except asyncio.TimeoutError:
+        except TimeoutError:
             if sys.platform != "win32":
                 os.killpg(os.getpgid(process.pid), signal.SIGKILL)
             else:
@@ -248,15 +247,12 @@ class ShellTool(Tool):
         shell_environment = self.config.shell_environment
 
         if not shell_environment.ignore_default_excludes:
-            for pattern in shell_environment.exclude_patterns:
-                keys_to_remove: list[str] = [
-                    k
-                    for k in env.keys()
-                    if fnmatch.fnmatch(k.upper(), pattern.upper())
-                ]
-
-                for k in keys_to_remove:
-                    del env[k]
+            # One combined regex instead of one fnmatch pass per pattern.
+            exclude_regex = shell_environment.exclude_regex
+            if exclude_regex is not None:
+                env = {
+                    k: v for k, v in env.items() if not exclude_regex.match(k.upper())
+                }
 
         if shell_environment.set_vars:
             env.update(shell_environment.set_vars)
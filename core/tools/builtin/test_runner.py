@@ -11,10 +11,10 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolInvocation, ToolKind, ToolResult
 from core.tools.registration.decorator import register_tool
-from core.utils.paths import resolve_path
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +98,7 @@ def _detect_test_framework(cwd: Path) -> str | None:
         # Check if there are test files
         for test_dir in [cwd / "test", cwd / "tests"]:
             if test_dir.exists():
-                for py_file in test_dir.rglob("test_*.py"):
+                for _ in test_dir.rglob("test_*.py"):
                     return "unittest"  # Likely unittest
 
     return None
@@ -132,7 +132,7 @@ class RunTestsTool(Tool):
     kind: ToolKind = ToolKind.SHELL
     schema: type[RunTestsParams] = RunTestsParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
 
     async def execute(self, invocation: ToolInvocation) -> ToolResult:
@@ -7,10 +7,10 @@ with support for adding, completing, listing, and clearing todos.
 
 import logging
 import uuid
-from typing import Any
 
 from pydantic import BaseModel, Field
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolInvocation, ToolKind, ToolResult
 
@@ -69,7 +69,7 @@ class TodosTool(Tool):
     kind: ToolKind = ToolKind.MEMORY
     schema: type[TodosParams] = TodosParams
 
-    def __init__(self, config) -> None:
+    def __init__(self, config: Configuration) -> None:
         super().__init__(config)
         self._todos: dict[str, str] = {}
 
@@ -98,7 +98,7 @@ class TodosTool(Tool):
         if params.action.lower() == "add":
             if not params.content:
                 return ToolResult.error_result("`content` required for 'add' action")
-            todo_id: str = str(uuid.uuid4())[:8]
+            todo_id: str = uuid.uuid4().hex[:8]
             self._todos[todo_id] = params.content
             return ToolResult.success_result(
                 f"Added todo [{todo_id}]: {params.content}",
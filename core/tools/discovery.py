@@ -107,27 +107,33 @@ class ToolDiscoveryManager:
 
         return tools
 
-    def discover_from_directory(self, directory: Path) -> None:
+    def load_from_directory(self, directory: Path) -> list[Tool]:
         """
-        Discover tools from a directory.
+        Load tools from a directory without registering them.
 
         Searches for `.ai-agent/tools/*.py` files in the given directory
-        and loads any Tool classes found.
+        and instantiates any Tool classes found.
 
         Parameters
         ----------
         directory : Path
             Directory to search for tools.
 
+        Returns
+        -------
+        list[Tool]
+            Tools found, in discovery order.
+
         Examples
         --------
-        >>> manager.discover_from_directory(Path("/path/to/project"))
+        >>> tools = manager.load_from_directory(Path("/path/to/project"))
         """
         tool_dir: Path = directory / ".ai-agent" / "tools"
 
         if not tool_dir.exists() or not tool_dir.is_dir():
-            return
+            return []
 
+        tools: list[Tool] = []
         for py_file in tool_dir.glob("*.py"):
             try:
                 if py_file.name.startswith("__"):
@@ -140,9 +146,7 @@ class ToolDiscoveryManager:
                     continue
 
                 for tool_class in tool_classes:
-                    tool = tool_class(self.config)
-                    self.registry.register(tool)
-                    logger.info(f"Discovered and registered tool: {tool.name}")
+                    tools.append(tool_class(self.config))
 
             except Exception as e:
                 logger.warning(
@@ -150,6 +154,65 @@ class ToolDiscoveryManager:
                     exc_info=True,
                 )
 
+        return tools
+
+    def load_all(self) -> list[Tool]:
+        """
+        Load tools from all configured directories without registering them.
+
+        Searches the current working directory and then the user config
+        directory, so this only does file and import work and can run in
+        a worker thread. Pass the result to ``register`` afterwards.
+
+        Returns
+        -------
+        list[Tool]
+            Tools found, in discovery order.
+
+        Examples
+        --------
+        >>> manager.register(await asyncio.to_thread(manager.load_all))
+        """
+        return [
+            *self.load_from_directory(self.config.cwd),
+            *self.load_from_directory(get_config_dir()),
+        ]
+
+    def register(self, tools: list[Tool]) -> None:
+        """
+        Register loaded tools with the tool registry, in order.
+
+        Parameters
+        ----------
+        tools : list[Tool]
+            Tools returned by ``load_all`` or ``load_from_directory``.
+
+        Examples
+        --------
+        >>> manager.register(manager.load_all())
+        """
+        for tool in tools:
+            self.registry.register(tool)
+            logger.info(f"Discovered and registered tool: {tool.name}")
+
+    def discover_from_directory(self, directory: Path) -> None:
+        """
+        Discover tools from a directory.
+
+        Searches for `.ai-agent/tools/*.py` files in the given directory
+        and loads any Tool classes found.
+
+        Parameters
+        ----------
+        directory : Path
+            Directory to search for tools.
+
+        Examples
+        --------
+        >>> manager.discover_from_directory(Path("/path/to/project"))
+        """
+        self.register(self.load_from_directory(directory))
+
     def discover_all(self) -> None:
         """
         Discover tools from all configured directories.
@@ -161,5 +224,4 @@ class ToolDiscoveryManager:
         --------
         >>> manager.discover_all()
         """
-        self.discover_from_directory(self.config.cwd)
-        self.discover_from_directory(get_config_dir())
+        self.register(self.load_all())
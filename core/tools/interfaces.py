@@ -6,7 +6,6 @@ and testing through dependency injection.
 """
 
 from typing import Any, Protocol
-from pathlib import Path
 
 from core.tools.models import ToolInvocation, ToolResult
 
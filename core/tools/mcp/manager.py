@@ -88,13 +88,13 @@ class MCPManager:
                 client.connect(),
                 timeout=client.config.startup_timeout_sec,
             )
-            for name, client in self._clients.items()
+            for client in self._clients.values()
         ]
 
         results = await asyncio.gather(*connection_tasks, return_exceptions=True)
 
         # Log connection results
-        for (name, client), result in zip(self._clients.items(), results):
+        for name, result in zip(self._clients, results, strict=True):
             if isinstance(result, Exception):
                 logger.warning(
                     f"Failed to connect to MCP server '{name}': {result}",
@@ -4,13 +4,13 @@ Data models for MCP integration.
 This module defines models for MCP server status and tool information.
 """
 
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
-class MCPServerStatus(str, Enum):
+class MCPServerStatus(StrEnum):
     """
     Status of an MCP server connection.
 
@@ -8,6 +8,7 @@ as regular tools in the tool registry.
 import logging
 from typing import Any
 
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.mcp.client import MCPClient
 from core.tools.mcp.models import MCPToolInfo
@@ -55,7 +56,7 @@ class MCPTool(Tool):
 
     def __init__(
         self,
-        config,
+        config: Configuration,
         client: MCPClient,
         tool_info: MCPToolInfo,
         name: str,
@@ -6,14 +6,14 @@ including tool results, invocations, and file diffs.
 """
 
 import difflib
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
-class ToolKind(str, Enum):
+class ToolKind(StrEnum):
     """
     Categories of tools based on their operation type.
 
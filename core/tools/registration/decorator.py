@@ -5,9 +5,9 @@ This module provides decorators for automatically registering tools
 with custom names, descriptions, and metadata.
 """
 
-import functools
 import logging
-from typing import Any, Callable, TypeVar
+from collections.abc import Callable
+from typing import TypeVar
 
 from core.tools.base import Tool
 
@@ -53,12 +53,8 @@ def register_tool(
     ...     # ... implementation
     """
     def decorator(cls: T) -> T:
-        tool_name = name or getattr(cls, "name", cls.__name__.lower())
-        tool_description = description or getattr(
-            cls,
-            "description",
-            cls.__doc__ or "No description",
-        )
+        tool_name: str = name or cls.name
+        tool_description: str = description or cls.description
 
         # Override if provided
         if name:
@@ -6,7 +6,6 @@ tool instances and registering them with a registry.
 """
 
 import logging
-from typing import Any
 
 from core.config.schema import Configuration
 from core.tools.base import Tool
@@ -9,7 +9,6 @@ import importlib
 import inspect
 import logging
 import pkgutil
-from pathlib import Path
 from typing import Any
 
 from core.config.schema import Configuration
@@ -97,7 +96,7 @@ def load_tools_from_package(
         tools.extend(load_tools_from_module(package, config))
 
         # Load from submodules
-        for importer, modname, ispkg in pkgutil.walk_packages(
+        for _, modname, _ in pkgutil.walk_packages(
             package.__path__,
             package.__name__ + ".",
         ):
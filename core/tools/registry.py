@@ -6,6 +6,7 @@ with proper validation, approval checking, and hook integration.
 """
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -40,6 +41,10 @@ class ToolRegistry:
         Dictionary of registered tools keyed by name.
     _mcp_tools : dict[str, Tool]
         Dictionary of MCP tools keyed by name.
+    _schemas_cache : list[dict[str, Any]] | None
+        Cached tool schemas, invalidated whenever tools change.
+    _schemas_cache_filter : tuple[str, ...] | None
+        ``allowed_tools`` value the cached schemas were built with.
 
     Examples
     --------
@@ -55,6 +60,8 @@ class ToolRegistry:
         self.config: Configuration = config
         self._tools: dict[str, Tool] = {}
         self._mcp_tools: dict[str, Tool] = {}
+        self._schemas_cache: list[dict[str, Any]] | None = None
+        self._schemas_cache_filter: tuple[str, ...] | None = None
 
     @property
     def connected_mcp_servers(self) -> list[Tool]:
@@ -85,8 +92,35 @@ class ToolRegistry:
             logger.warning(f"Overwriting existing tool: {tool.name}")
 
         self._tools[tool.name] = tool
+        self._schemas_cache = None
         logger.debug(f"Registered tool: {tool.name}")
 
+    def register_many(self, tools: Iterable[Tool]) -> None:
+        """
+        Register several tools at once.
+
+        Equivalent to calling ``register`` for each tool, but the tool
+        table is updated in one step and the schema cache is invalidated
+        once.
+
+        Parameters
+        ----------
+        tools : Iterable[Tool]
+            Tool instances to register.
+
+        Examples
+        --------
+        >>> registry.register_many([ReadFileTool(config), GrepTool(config)])
+        """
+        new_tools: dict[str, Tool] = {tool.name: tool for tool in tools}
+
+        for name in new_tools.keys() & self._tools.keys():
+            logger.warning(f"Overwriting existing tool: {name}")
+
+        self._tools.update(new_tools)
+        self._schemas_cache = None
+        logger.debug(f"Registered {len(new_tools)} tools")
+
     def register_mcp_tool(self, tool: Tool) -> None:
         """
         Register an MCP tool in the registry.
@@ -101,6 +135,7 @@ class ToolRegistry:
         >>> registry.register_mcp_tool(mcp_tool)
         """
         self._mcp_tools[tool.name] = tool
+        self._schemas_cache = None
         logger.debug(f"Registered MCP tool: {tool.name}")
 
     def unregister(self, name: str) -> bool:
@@ -123,6 +158,7 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self._schemas_cache = None
             logger.debug(f"Unregistered tool: {name}")
             return True
 
@@ -155,6 +191,29 @@ class ToolRegistry:
 
         return None
 
+    def is_parallel_safe(self, name: str) -> bool:
+        """
+        Check whether a tool may run concurrently with other calls.
+
+        Parameters
+        ----------
+        name : str
+            Name of the tool.
+
+        Returns
+        -------
+        bool
+            True if the tool is parallel-safe. Unknown tools are reported
+            as safe since invoking them only produces an error result.
+
+        Examples
+        --------
+        >>> registry.is_parallel_safe("read_file")
+        True
+        """
+        tool = self.get(name)
+        return tool is None or tool.parallel_safe
+
     def get_tools(self) -> list[Tool]:
         """
         Get all available tools, optionally filtered by allowed_tools config.
@@ -188,6 +247,10 @@ class ToolRegistry:
         """
         Get OpenAI-compatible schemas for all tools.
 
+        Schemas are built once and reused until a tool is registered or
+        unregistered, or ``allowed_tools`` changes. The returned list is
+        shared and must not be mutated.
+
         Returns
         -------
         list[dict[str, Any]]
@@ -198,7 +261,13 @@ class ToolRegistry:
         >>> schemas = registry.get_schemas()
         >>> # Use with LLM client
         """
-        return [tool.to_openai_schema() for tool in self.get_tools()]
+        allowed: tuple[str, ...] | None = (
+            tuple(self.config.allowed_tools) if self.config.allowed_tools else None
+        )
+        if self._schemas_cache is None or allowed != self._schemas_cache_filter:
+            self._schemas_cache = [tool.to_openai_schema() for tool in self.get_tools()]
+            self._schemas_cache_filter = allowed
+        return self._schemas_cache
 
     async def invoke(
         self,
@@ -7,18 +7,16 @@ and limited tool access for specialized tasks.
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from pydantic import BaseModel, Field
 
 from core.agent.events import AgentEventType
+from core.config.schema import Configuration
 from core.tools.base import Tool
 from core.tools.models import ToolInvocation, ToolKind, ToolResult
 from core.tools.subagents.models import SubagentDefinition
 
-if TYPE_CHECKING:
-    from core.agent.agent import Agent
-
 logger = logging.getLogger(__name__)
 
 
@@ -71,33 +69,11 @@ class SubagentTool(Tool):
         Parameter schema.
     """
 
-    def __init__(self, config, definition: SubagentDefinition) -> None:
+    def __init__(self, config: Configuration, definition: SubagentDefinition) -> None:
         super().__init__(config)
         self.definition: SubagentDefinition = definition
-
-    @property
-    def name(self) -> str:
-        """
-        Get the tool name.
-
-        Returns
-        -------
-        str
-            Tool name in format "subagent_{definition_name}".
-        """
-        return f"subagent_{self.definition.name}"
-
-    @property
-    def description(self) -> str:
-        """
-        Get the tool description.
-
-        Returns
-        -------
-        str
-            Tool description from definition.
-        """
-        return self.definition.description
+        self.name: str = f"subagent_{definition.name}"
+        self.description: str = definition.description
 
     schema: type[SubagentParams] = SubagentParams
     kind: ToolKind = ToolKind.MEMORY
@@ -149,14 +125,16 @@ class SubagentTool(Tool):
         from core.agent.agent import Agent
 
         # Create subagent configuration
-        config_dict = self.config.to_dict()
+        # Python-mode dump keeps Path and enum values, so validation does
+        # not have to parse them back from strings.
+        config_dict = self.config.model_dump()
         config_dict["max_turns"] = self.definition.max_turns
         if self.definition.allowed_tools:
             config_dict["allowed_tools"] = self.definition.allowed_tools
 
         from core.config.schema import Configuration
 
-        subagent_config = Configuration(**config_dict)
+        subagent_config = Configuration.model_validate(config_dict)
 
         prompt: str = f"""You are a specialized sub-agent with a specific task to complete.
 
@@ -208,7 +186,7 @@ IMPORTANT:
             error = str(e)
             final_response = f"Sub-agent failed: {e}"
 
-        result: str = f"""Sub-agent '{self.definition.name}' completed. 
+        result: str = f"""Sub-agent '{self.definition.name}' completed.
 Termination: {terminate_response}
 Tools called: {', '.join(tool_calls) if tool_calls else 'None'}
 
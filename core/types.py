@@ -5,26 +5,26 @@ This module provides common type aliases and type definitions used throughout
 the codebase to ensure consistency and type safety.
 """
 
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 from pathlib import Path
+from typing import Any
 
 # Message types for LLM interactions
 MessageRole = str  # "system", "user", "assistant", "tool"
-MessageContent = Union[str, List[Dict[str, Any]]]
-MessageDict = Dict[str, Any]
+MessageContent = str | list[dict[str, Any]]
+MessageDict = dict[str, Any]
 
 # Tool definitions
-ToolDefinition = Dict[str, Any]
-ToolDefinitions = List[ToolDefinition]
+ToolDefinition = dict[str, Any]
+ToolDefinitions = list[ToolDefinition]
 
 # Path types
-PathLike = Union[str, Path]
+PathLike = str | Path
 
 # Configuration types
-ConfigDict = Dict[str, Any]
+ConfigDict = dict[str, Any]
 
 # Token usage tracking
 TokenCount = int
 
 # Error context
-ErrorDetails = Dict[str, Any]
+ErrorDetails = dict[str, Any]
@@ -17,7 +17,6 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.rule import Rule
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
@@ -26,14 +25,14 @@ from core.safety.models import ToolConfirmation
 from core.ui.banner import get_banner
 from core.ui.formatters import (
     format_generic_output,
-    format_grep_output,
     format_glob_output,
+    format_grep_output,
     format_list_dir_output,
     format_memory_output,
     format_read_file_output,
     format_shell_output,
-    format_tool_arguments_table,
     format_todos_output,
+    format_tool_arguments_table,
     format_web_fetch_output,
     format_web_search_output,
     format_write_file_output,
@@ -299,13 +298,11 @@ class TUI:
         ... )
         """
         border_style: str = f"tool.{tool_kind}" if tool_kind else "tool"
-        # Enhanced status icons
-        status_icon: str = "✓" if success else "✗"
         status_style: str = "bold green" if success else "bold red"
-        
+
         # Add emoji for better visual feedback
         emoji_icon: str = "✅" if success else "❌"
-        
+
         title = Text.assemble(
             (f"{emoji_icon} ", status_style),
             (name, "bold tool"),
@@ -455,7 +452,7 @@ class TUI:
         else:
             subtitle_text.append("✗ ", style="bold red")
             subtitle_text.append("failed", style="dim red")
-        
+
         panel = Panel(
             Group(*blocks),
             title=title,
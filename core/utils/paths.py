@@ -8,7 +8,7 @@ file paths with proper error handling and type safety.
 import logging
 from pathlib import Path
 
-from core.constants import DEFAULT_BINARY_CHECK_CHUNK_SIZE, DEFAULT_ENCODING
+from core.constants import DEFAULT_BINARY_CHECK_CHUNK_SIZE
 from core.exceptions import ValidationError
 from core.types import PathLike
 
@@ -156,7 +156,7 @@ def is_binary_file(path: PathLike) -> bool:
         with open(path_obj, "rb") as f:
             chunk: bytes = f.read(DEFAULT_BINARY_CHECK_CHUNK_SIZE)
             return b"\x00" in chunk
-    except (OSError, IOError) as e:
+    except OSError as e:
         logger.warning(f"Failed to check if file is binary: {path_obj}: {e}")
         return False
 
@@ -5,16 +5,19 @@ This module provides the command-line interface with interactive and
 single-run modes, command handling, and session management.
 """
 
-import asyncio
 import logging
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import click
 from dotenv import load_dotenv
+from rich import box
+from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from core.agent.agent import Agent
 from core.agent.events import AgentEventType
@@ -28,6 +31,7 @@ from core.llm.ollama import (
     get_ollama_model_info,
     list_ollama_models,
 )
+from core.runtime import run
 from core.ui.console import get_console
 from core.ui.tui import TUI
 
@@ -203,7 +207,7 @@ class CLI:
         >>> kind = cli._get_tool_kind("read_file")
         >>> # Returns "read"
         """
-        if not self.agent:
+        if not self.agent or not self.agent.session:
             return None
 
         tool = self.agent.session.tool_registry.get(tool_name)
@@ -309,8 +313,10 @@ class CLI:
         --------
         >>> should_continue = await cli._handle_command("/help")
         """
-        if not self.agent:
+        session = self.agent.session if self.agent else None
+        if not session or not session.context_manager:
             return True
+        context_manager = session.context_manager
 
         cmd: str = command.lower().strip()
         parts: list[str] = cmd.split(maxsplit=1)
@@ -322,8 +328,8 @@ class CLI:
         elif command == "/help":
             self.tui.show_help()
         elif command == "/clear":
-            self.agent.session.context_manager.clear()
-            self.agent.session.loop_detector.clear()
+            context_manager.clear()
+            session.loop_detector.clear()
             console.print("[success]Conversation cleared [/success]")
         elif command == "/config":
             console.print("\n[bold]Current Configuration[/bold]")
@@ -412,7 +418,7 @@ class CLI:
                         f"[success]Approval policy changed to: {cmd_args} [/success]",
                     )
                 except ValueError:
-                    valid_options: str = ", ".join(
+                    valid_options = ", ".join(
                         p.value for p in ApprovalPolicy)
                     console.print(
                         f"[error]Incorrect approval policy: {cmd_args} [/error]",
@@ -423,17 +429,17 @@ class CLI:
                     f"Current approval policy: {self.config.approval.value}",
                 )
         elif cmd_name == "/stats":
-            stats: dict[str, Any] = self.agent.session.get_stats()
+            stats: dict[str, Any] = session.get_stats()
             console.print("\n[bold]Session Statistics [/bold]")
             for key, value in stats.items():
                 console.print(f"   {key}: {value}")
         elif cmd_name == "/tools":
-            tools = self.agent.session.tool_registry.get_tools()
+            tools = session.tool_registry.get_tools()
             console.print(f"\n[bold]Available tools ({len(tools)}) [/bold]")
             for tool in tools:
                 console.print(f"  • {tool.name}")
         elif cmd_name == "/mcp":
-            mcp_servers = self.agent.session.mcp_manager.get_all_servers()
+            mcp_servers = session.mcp_manager.get_all_servers()
             console.print(f"\n[bold]MCP Servers ({len(mcp_servers)}) [/bold]")
             for server in mcp_servers:
                 status: str = server["status"]
@@ -445,25 +451,26 @@ class CLI:
         elif cmd_name == "/save":
             persistence_manager = PersistenceManager()
             session_snapshot = SessionSnapshot(
-                session_id=self.agent.session.session_id,
-                created_at=self.agent.session.created_at,
-                updated_at=self.agent.session.updated_at,
-                turn_count=self.agent.session.turn_count,
-                messages=self.agent.session.context_manager.get_messages(),
-                total_usage=self.agent.session.context_manager.total_usage,
+                session_id=session.session_id,
+                created_at=session.created_at,
+                updated_at=session.updated_at,
+                turn_count=session.turn_count,
+                messages=context_manager.get_messages(),
+                total_usage=context_manager.total_usage,
             )
-            persistence_manager.save_session(session_snapshot)
+            await persistence_manager.save_session(session_snapshot)
             console.print(
-                f"[success]Session saved: {self.agent.session.session_id}[/success]",
+                f"[success]Session saved: {session.session_id}[/success]",
             )
         elif cmd_name == "/sessions":
             persistence_manager = PersistenceManager()
             sessions = persistence_manager.list_sessions()
             console.print("\n[bold]Saved Sessions[/bold]")
             for s in sessions:
+                updated_at = datetime.fromtimestamp(s["updated_at"])
                 console.print(
                     f"  • {s['session_id']} "
-                    f"(turns: {s['turn_count']}, updated: {s['updated_at']})",
+                    f"(turns: {s['turn_count']}, updated: {updated_at:%Y-%m-%d %H:%M:%S})",
                 )
         elif cmd_name == "/resume":
             if not cmd_args:
@@ -473,14 +480,14 @@ class CLI:
         elif cmd_name == "/checkpoint":
             persistence_manager = PersistenceManager()
             session_snapshot = SessionSnapshot(
-                session_id=self.agent.session.session_id,
-                created_at=self.agent.session.created_at,
-                updated_at=self.agent.session.updated_at,
-                turn_count=self.agent.session.turn_count,
-                messages=self.agent.session.context_manager.get_messages(),
-                total_usage=self.agent.session.context_manager.total_usage,
+                session_id=session.session_id,
+                created_at=session.created_at,
+                updated_at=session.updated_at,
+                turn_count=session.turn_count,
+                messages=context_manager.get_messages(),
+                total_usage=context_manager.total_usage,
             )
-            checkpoint_id: str = persistence_manager.save_checkpoint(
+            checkpoint_id: str = await persistence_manager.save_checkpoint(
                 session_snapshot)
             console.print(
                 f"[success]Checkpoint created: {checkpoint_id}[/success]")
@@ -525,7 +532,7 @@ class CLI:
 
                 console.print()
                 console.print(table)
-                console.print(f"\n[dim]Use /model <name> to select a model[/dim]")
+                console.print("\n[dim]Use /model <name> to select a model[/dim]")
             except ConnectionError as e:
                 console.print(f"\n[error]Failed to connect to Ollama: {e}[/error]")
                 console.print("[dim]Make sure Ollama is running[/dim]")
@@ -550,7 +557,7 @@ class CLI:
         --------
         >>> await cli._resume_session("session_123")
         """
-        if not self.agent:
+        if not self.agent or not self.agent.session:
             return
 
         persistence_manager = PersistenceManager()
@@ -562,13 +569,16 @@ class CLI:
         # Create new session
         session = Session(config=self.config)
         await session.initialize()
+        context_manager = session.context_manager
+        if context_manager is None:
+            raise RuntimeError("Session context manager not initialized")
 
         # Restore session metadata
         session.session_id = snapshot.session_id
         session.created_at = snapshot.created_at
         session.updated_at = snapshot.updated_at
         session.turn_count = snapshot.turn_count
-        session.context_manager.total_usage = snapshot.total_usage
+        context_manager.total_usage = snapshot.total_usage
 
         # Restore messages
         for msg in snapshot.messages:
@@ -576,15 +586,15 @@ class CLI:
             if role == "system":
                 continue
             elif role == "user":
-                session.context_manager.add_user_message(
+                context_manager.add_user_message(
                     msg.get("content", ""))
             elif role == "assistant":
-                session.context_manager.add_assistant_message(
+                context_manager.add_assistant_message(
                     msg.get("content", ""),
                     msg.get("tool_calls"),
                 )
             elif role == "tool":
-                session.context_manager.add_tool_result(
+                context_manager.add_tool_result(
                     msg.get("tool_call_id", ""),
                     msg.get("content", ""),
                 )
@@ -612,7 +622,7 @@ class CLI:
         --------
         >>> await cli._restore_checkpoint("checkpoint_123")
         """
-        if not self.agent:
+        if not self.agent or not self.agent.session:
             return
 
         persistence_manager = PersistenceManager()
@@ -624,13 +634,16 @@ class CLI:
         # Create new session
         session = Session(config=self.config)
         await session.initialize()
+        context_manager = session.context_manager
+        if context_manager is None:
+            raise RuntimeError("Session context manager not initialized")
 
         # Restore session metadata
         session.session_id = snapshot.session_id
         session.created_at = snapshot.created_at
         session.updated_at = snapshot.updated_at
         session.turn_count = snapshot.turn_count
-        session.context_manager.total_usage = snapshot.total_usage
+        context_manager.total_usage = snapshot.total_usage
 
         # Restore messages
         for msg in snapshot.messages:
@@ -638,15 +651,15 @@ class CLI:
             if role == "system":
                 continue
             elif role == "user":
-                session.context_manager.add_user_message(
+                context_manager.add_user_message(
                     msg.get("content", ""))
             elif role == "assistant":
-                session.context_manager.add_assistant_message(
+                context_manager.add_assistant_message(
                     msg.get("content", ""),
                     msg.get("tool_calls"),
                 )
             elif role == "tool":
-                session.context_manager.add_tool_result(
+                context_manager.add_tool_result(
                     msg.get("tool_call_id", ""),
                     msg.get("content", ""),
                 )
@@ -700,11 +713,11 @@ def main(
     cli = CLI(config)
 
     if prompt:
-        result = asyncio.run(cli.run_single(prompt))
+        result = run(cli.run_single(prompt))
         if result is None:
             sys.exit(1)
     else:
-        asyncio.run(cli.run_interactive())
+        run(cli.run_interactive())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+"""
+Tests for hook environment building.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.config.schema import Configuration, HookTrigger
+from core.hooks.environment import build_hook_environment
+
+
+def test_hook_environment_sees_later_environment_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    config = Configuration(cwd=tmp_path)
+    monkeypatch.setenv("DRIFT_TEST_VALUE", "before")
+    build_hook_environment(config, HookTrigger.BEFORE_AGENT)
+
+    monkeypatch.setenv("DRIFT_TEST_VALUE", "after")
+    env: dict[str, str] = build_hook_environment(config, HookTrigger.BEFORE_AGENT)
+
+    assert env["DRIFT_TEST_VALUE"] == "after"
+    assert env["AI_AGENT_CWD"] == str(tmp_path)
@@ -0,0 +1,112 @@
+"""
+Tests for hook command execution.
+"""
+
+import asyncio
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from core.config.schema import HookConfig, HookTrigger
+from core.hooks import executor
+from core.hooks.executor import _split_command, execute_hook
+
+
+class _SpawnRecorder:
+    """
+    Record which subprocess factory a hook used, then run it for real.
+    """
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+        real_exec = asyncio.create_subprocess_exec
+        real_shell = asyncio.create_subprocess_shell
+
+        async def spy_exec(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+            self.calls.append(("exec", args))
+            return await real_exec(*args, **kwargs)
+
+        async def spy_shell(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+            self.calls.append(("shell", args))
+            return await real_shell(*args, **kwargs)
+
+        monkeypatch.setattr(executor.asyncio, "create_subprocess_exec", spy_exec)
+        monkeypatch.setattr(executor.asyncio, "create_subprocess_shell", spy_shell)
+
+
+def _hook(command: str, **kwargs: Any) -> HookConfig:
+    return HookConfig(
+        name="test",
+        trigger=HookTrigger.AFTER_TOOL,
+        command=command,
+        **kwargs,
+    )
+
+
+def test_hook_commands_use_the_shell_by_default() -> None:
+    assert _hook("echo hello").shell is True
+
+
+@pytest.mark.parametrize("command", ["echo hello", "time true"])
+async def test_builtin_commands_still_run_through_the_shell(
+    command: str,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    recorder = _SpawnRecorder(monkeypatch)
+
+    await execute_hook(_hook(command), dict(os.environ), tmp_path)
+
+    assert recorder.calls == [("shell", (command,))]
+
+
+@pytest.mark.parametrize("command", ["echo 'a\\tb'", "printf '%s' x"])
+async def test_builtin_command_output_matches_the_shell(
+    command: str,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    # /bin/echo and /usr/bin/printf can differ from the shell's versions, so
+    # a default hook must produce exactly what ``sh -c`` produces.
+    results: list[tuple[bytes, bytes, int | None]] = []
+
+    async def capture(process: asyncio.subprocess.Process, timeout: float) -> None:
+        stdout, stderr = await process.communicate()
+        results.append((stdout, stderr, process.returncode))
+
+    monkeypatch.setattr(executor, "_communicate", capture)
+    env: dict[str, str] = dict(os.environ)
+
+    await execute_hook(_hook(command), env, tmp_path)
+    expected = subprocess.run(
+        ["/bin/sh", "-c", command],
+        capture_output=True,
+        cwd=tmp_path,
+        env=env,
+    )
+
+    assert results == [(expected.stdout, expected.stderr, expected.returncode)]
+
+
+async def test_plain_commands_run_directly_when_shell_is_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    recorder = _SpawnRecorder(monkeypatch)
+    env: dict[str, str] = dict(os.environ)
+
+    await execute_hook(_hook("true", shell=False), env, tmp_path)
+
+    assert [kind for kind, _ in recorder.calls] == ["exec"]
+
+
+def test_split_command_keeps_shell_syntax_and_builtins_for_the_shell(
+    tmp_path: Path,
+) -> None:
+    path: str | None = os.environ.get("PATH")
+
+    assert _split_command("make test | tee log.txt", path, str(tmp_path)) is None
+    assert _split_command("cd build", path, str(tmp_path)) is None